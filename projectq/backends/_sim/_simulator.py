@@ -61,7 +61,7 @@ class Simulator(BasicEngine):
         export OMP_PROC_BIND=spread # bind threads to processors by spreading
     """
 
-    def __init__(self, gate_fusion=False, rnd_seed=None):
+    def __init__(self, gate_fusion=False, rnd_seed=None, precision='double'):
         """
         Construct the C++/Python-simulator object and initialize it with a random seed.
 
@@ -69,6 +69,9 @@ class Simulator(BasicEngine):
             gate_fusion (bool): If True, gates are cached and only executed once a certain gate-size has been reached
                 (only has an effect for the c++ simulator).
             rnd_seed (int): Random seed (uses random.randint(0, 4294967295) by default).
+            precision (str): Either 'double' (default) or 'single'; selects the floating-point precision of the state
+                vector. Single precision halves the memory traffic of every state-vector pass, at roughly 7
+                significant digits instead of 16 (only supported by the Python simulator).
 
         Example of gate_fusion: Instead of applying a Hadamard gate to 5 qubits, the simulator calculates the
         kronecker product of the 1-qubit gate matrices and then applies one 5-qubit gate. This increases operational
@@ -86,7 +89,13 @@ class Simulator(BasicEngine):
         if rnd_seed is None:
             rnd_seed = random.randint(0, 4294967295)
         super().__init__()
-        self._simulator = SimulatorBackend(rnd_seed)
+        if FALLBACK_TO_PYSIM:
+            self._simulator = SimulatorBackend(rnd_seed, precision=precision)
+        else:
+            # The C++ kernels are compiled for double precision only.
+            if precision != 'double':
+                raise ValueError("The C++ simulator only supports double precision!")
+            self._simulator = SimulatorBackend(rnd_seed)
         self._gate_fusion = gate_fusion
 
     def is_available(self, cmd):
@@ -235,6 +235,33 @@ def test_simulator_cheat(sim):
     assert len(sim.cheat()[1]) == 1
 
 
+def test_simulator_precision():
+    from projectq.backends._sim._simulator import FALLBACK_TO_PYSIM
+
+    with pytest.raises(ValueError):
+        Simulator(precision='half')
+
+    if not FALLBACK_TO_PYSIM:
+        # The C++ kernels are compiled for double precision only.
+        with pytest.raises(ValueError):
+            Simulator(precision='single')
+        return
+
+    sim = Simulator(precision='single')
+    eng = MainEngine(sim, [])
+    qureg = eng.allocate_qureg(2)
+    H | qureg[0]
+    CNOT | (qureg[0], qureg[1])
+    eng.flush()
+
+    assert numpy.asarray(sim.cheat()[1]).dtype == numpy.complex64
+    assert abs(sim.get_amplitude('00', qureg)) == pytest.approx(1.0 / math.sqrt(2), abs=1e-5)
+    assert abs(sim.get_amplitude('11', qureg)) == pytest.approx(1.0 / math.sqrt(2), abs=1e-5)
+
+    All(Measure) | qureg
+    eng.flush()
+
+
 def test_simulator_functional_measurement(sim):
     eng = MainEngine(sim, [])
     qubits = eng.allocate_qureg(5)
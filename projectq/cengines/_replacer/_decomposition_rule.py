@@ -20,7 +20,9 @@
 class DecompositionRule:  # pylint: disable=too-few-public-methods
     """A rule for breaking down specific gates into sequences of simpler gates."""
 
-    def __init__(self, gate_class, gate_decomposer, gate_recognizer=lambda cmd: True, rule_priority=0):
+    def __init__(  # pylint: disable=too-many-arguments
+        self, gate_class, gate_decomposer, gate_recognizer=lambda cmd: True, rule_priority=0, chooser_tag=None
+    ):
         """
         Initialize a DecompositionRule object.
 
@@ -42,8 +44,12 @@ class DecompositionRule:  # pylint: disable=too-few-public-methods
                 For example, a decomposition rule may only to apply rotation gates that rotate by a specific angle.
 
                 If no gate_recognizer is given, the decomposition applies to all gates matching the gate_class.
+
+            chooser_tag (tuple): Optional (family name, variant) tag used by decomposition choosers to identify this
+                rule without parsing the decomposer's function name (e.g. ('cnot2rxx', 'M')).
         """
         self.gate_class = gate_class.klass
         self.gate_decomposer = gate_decomposer
         self.gate_recognizer = gate_recognizer
         self.rule_priority = rule_priority
+        self.chooser_tag = chooser_tag
@@ -53,7 +53,7 @@ class DecompositionRuleSet:
         Args:
             rule (DecompositionRuleGate): The decomposition rule to add.
         """
-        decomp_obj = _Decomposition(rule.gate_decomposer, rule.gate_recognizer, rule.rule_priority)
+        decomp_obj = _Decomposition(rule.gate_decomposer, rule.gate_recognizer, rule.rule_priority, rule.chooser_tag)
         cls = rule.gate_class.__name__
         if cls not in self.decompositions:
             self.decompositions[cls] = []
@@ -76,7 +76,7 @@ class ModuleWithDecompositionRuleSet:  # pragma: no cover # pylint: disable=too-
 class _Decomposition:  # pylint: disable=too-few-public-methods
     """The Decomposition class can be used to register a decomposition rule (by calling register_decomposition)."""
 
-    def __init__(self, replacement_fun, recogn_fun, priority):
+    def __init__(self, replacement_fun, recogn_fun, priority, chooser_tag=None):
         """
         Initialize a Decomposition object.
 
@@ -84,6 +84,8 @@ class _Decomposition:  # pylint: disable=too-few-public-methods
             replacement_fun: Function that, when called with a `Command` object, decomposes this command.
             recogn_fun: Function that, when called with a `Command` object, returns True if and only if the
                 replacement rule can handle this command.
+            chooser_tag: Optional (family name, variant) tag forwarded from the DecompositionRule for decomposition
+                choosers.
 
         Every Decomposition is registered with the gate class. The Decomposition rule is then potentially valid for
         all objects which are an instance of that same class (i.e., instance of gate_object.__class__). All other
@@ -114,6 +116,7 @@ class _Decomposition:  # pylint: disable=too-few-public-methods
         self.decompose = replacement_fun
         self.check = recogn_fun
         self.priority = priority
+        self.chooser_tag = chooser_tag
 
     def get_inverse_decomposition(self):
         """
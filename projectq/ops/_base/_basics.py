@@ -49,6 +49,11 @@ ANGLE_TOLERANCE = 10 ** -ANGLE_PRECISION
 RTOL = 1e-10
 ATOL = 1e-12
 
+# Looked up once; the Unicode database query is not free and to_string uses
+# this for every angle displayed with symbols=True.
+_PI_SYMBOL = unicodedata.lookup("GREEK SMALL LETTER PI")
+_INV_PI = 1.0 / math.pi
+
 
 class _ClassDescriptor:
     """
@@ -60,14 +65,25 @@ class _ClassDescriptor:
     """
 
     # pylint: disable=too-few-public-methods
+    def __init__(self):
+        # The result only depends on the class, so cache it per class; klass
+        # is dereferenced in __eq__/__hash__/to_string hot paths.
+        self._cache = {}
+
     def __get__(self, obj, objtype):
-        if (
-            issubclass(objtype, DispatchGateClass)
-            and len(objtype.__bases__) > 1
-            and any(not issubclass(obj, DispatchGateClass) for obj in objtype.__bases__)
-        ):
-            return objtype.__mro__[1]
-        return objtype
+        try:
+            return self._cache[objtype]
+        except KeyError:
+            if (
+                issubclass(objtype, DispatchGateClass)
+                and len(objtype.__bases__) > 1
+                and any(not issubclass(base, DispatchGateClass) for base in objtype.__bases__)
+            ):
+                klass = objtype.__mro__[1]
+            else:
+                klass = objtype
+            self._cache[objtype] = klass
+            return klass
 
 
 class BasicGate:
@@ -394,10 +410,10 @@ class BasicAngleGate(BasicGate):
         """
         # pylint: disable=protected-access
         if symbols:
-            angle = str(round(self.angle / math.pi, 3)) + unicodedata.lookup("GREEK SMALL LETTER PI")
+            angle = str(round(self.angle * _INV_PI, 3)) + _PI_SYMBOL
         else:
             angle = self.angle
-        return '{}({})'.format(self.klass.__name__, angle)
+        return f'{self.klass.__name__}({angle})'
 
     def get_inverse(self):
         """Return the inverse of this rotation gate (negate the angle, return new object)."""
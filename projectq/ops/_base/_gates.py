@@ -266,16 +266,34 @@ class EntangleGate(BasicGate):
 Entangle = EntangleGate()
 
 
+# Non-symbolic types already seen by _is_symbolic; memoized so that the common
+# numeric dispatch path is a single set membership test instead of an
+# isinstance check against a foreign base class.
+_NUMERIC_ANGLE_TYPES = {int, float, complex}
+
+
+def _is_symbolic(*angles):
+    """
+    Check whether any of the given angles is a symbolic (sympy) expression.
+
+    NB: here we do consider sympy.Float and sympy.Integer as symbolic since operations on them such as +, *, etc. will
+    lead to expressions and not simple numbers.
+    """
+    for angle in angles:
+        if type(angle) not in _NUMERIC_ANGLE_TYPES:
+            if isinstance(angle, SympyBase):
+                return True
+            _NUMERIC_ANGLE_TYPES.add(type(angle))
+    return False
+
+
 class DispatchAngleGateClass(DispatchGateClass):
     """Dispatch base class for angle gate classes (phase- and rotation- gates)."""
 
     def __new__(cls, NumClass, ParamClass, angle):  # noqa: N803
         """Create an AngleGateClass gate, dispatching to either a numeric or parametric implementation."""
         if angle is not None:
-            if isinstance(angle, SympyBase):
-                # NB: here we do not consider sympy.Float and sympy.Integer as
-                # numbers since operation on them such as +, *, etc. will lead
-                # to expressions and not simple numbers
+            if _is_symbolic(angle):
                 return super().__new__(ParamClass)
             return super().__new__(NumClass)
 
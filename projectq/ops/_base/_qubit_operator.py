@@ -17,8 +17,10 @@
 
 import cmath
 import copy
+from functools import lru_cache
 from numbers import Number
 
+import numpy as np
 import sympy
 from sympy.core.basic import Basic as SympyBase
 
@@ -29,6 +31,11 @@ from ._gates import Ph, X, Y, Z
 
 EQ_TOLERANCE = 1e-12
 
+# Concrete coefficient types known to be valid; checked by exact type before
+# falling back to the slower isinstance chain. Types accepted by the fallback
+# are memoized here so each type pays the isinstance cost only once.
+_KNOWN_COEFF_TYPES = {int, float, complex, np.float64, np.complex128}
+
 # Define products of all Pauli operators for symbolic multiplication.
 _PAULI_OPERATOR_PRODUCTS = {
     ('I', 'I'): (1.0, 'I'),
@@ -50,6 +57,95 @@ _PAULI_OPERATOR_PRODUCTS = {
 }
 
 
+# Phase factors i**k picked up when multiplying bit-packed Pauli strings.
+# Kept as complex values so coefficients keep the same (complex) type they
+# would have acquired from the per-site scalar products.
+_PAULI_PHASES = (1, 1.0j, -1.0 + 0.0j, -1.0j)
+
+
+# Direct-addressed (x_bit, z_bit) encoding of the local Pauli operators used
+# when packing terms; a single dict lookup replaces per-action comparisons.
+_PAULI_BITS = {'X': (1, 0), 'Y': (1, 1), 'Z': (0, 1)}
+
+
+def _pack_term(term):
+    """
+    Pack a sorted Pauli term tuple into a pair of (x_mask, z_mask) integers.
+
+    Bit q of x_mask (z_mask) is set when an X or Y (Z or Y) operator acts on
+    qubit q; Python integers are unbounded, so any qubit index is supported.
+    """
+    x_mask = 0
+    z_mask = 0
+    for qubit, action in term:
+        x_bit, z_bit = _PAULI_BITS[action]
+        x_mask |= x_bit << qubit
+        z_mask |= z_bit << qubit
+    return x_mask, z_mask
+
+
+def _unpack_term(x_mask, z_mask):
+    """Convert a pair of (x_mask, z_mask) integers back into a sorted Pauli term tuple."""
+    term = []
+    mask = x_mask | z_mask
+    qubit = 0
+    while mask:
+        if mask & 1:
+            term.append((qubit, ('I', 'X', 'Z', 'Y')[((x_mask >> qubit) & 1) + ((z_mask >> qubit) & 1) * 2]))
+        mask >>= 1
+        qubit += 1
+    return tuple(term)
+
+
+def _pauli_phase_exponent(x1_mask, z1_mask, x2_mask, z2_mask):
+    """
+    Return the exponent k such that P1 * P2 = i**k * P3 for bit-packed Paulis.
+
+    Each qubit where the local product is XY, YZ or ZX contributes +1 and
+    each qubit with YX, ZY or XZ contributes -1; identical or identity local
+    operators contribute nothing.
+    """
+    plus = (
+        bin(x1_mask & ~z1_mask & x2_mask & z2_mask).count('1')  # X.Y = iZ
+        + bin(x1_mask & z1_mask & ~x2_mask & z2_mask).count('1')  # Y.Z = iX
+        + bin(~x1_mask & z1_mask & x2_mask & ~z2_mask).count('1')  # Z.X = iY
+    )
+    minus = (
+        bin(x1_mask & z1_mask & x2_mask & ~z2_mask).count('1')  # Y.X = -iZ
+        + bin(~x1_mask & z1_mask & x2_mask & z2_mask).count('1')  # Z.Y = -iX
+        + bin(x1_mask & ~z1_mask & ~x2_mask & z2_mask).count('1')  # X.Z = -iY
+    )
+    return (plus - minus) % 4
+
+
+@lru_cache(maxsize=256)
+def _parse_pauli_string(term):
+    """
+    Parse a Pauli string such as 'X0 Z2 Y5' into a sorted term tuple.
+
+    Memoized, since code that builds many operators (e.g. Hamiltonian
+    construction loops or parametric sweeps) tends to reuse a small set of
+    Pauli strings, and the split/validate/sort work is identical every time.
+
+    Raises:
+        ValueError, QubitOperatorError: Invalid Pauli string provided.
+    """
+    list_ops = []
+    for element in term.split():
+        if len(element) < 2:
+            raise ValueError('term specified incorrectly.')
+        list_ops.append((int(element[1:]), element[0]))
+    # Test that list_ops has correct format of tuples
+    for local_operator in list_ops:
+        qubit_num, action = local_operator
+        if not isinstance(action, str) or action not in 'XYZ':
+            raise ValueError("Invalid action provided: must be string 'X', 'Y', or 'Z'.")
+        if not (isinstance(qubit_num, int) and qubit_num >= 0):
+            raise QubitOperatorError("Invalid qubit number provided to QubitTerm: must be a non-negative int.")
+    list_ops.sort(key=lambda loc_operator: loc_operator[0])
+    return tuple(list_ops)
+
+
 def _phase(coefficient):
     # Here, we also force conversion of Sympy.Float, Sympy.Integer to float
     if isinstance(coefficient, Number) or coefficient.is_number:
@@ -161,9 +257,13 @@ class QubitOperator(BasicGate):
             QubitOperatorError: Invalid operators provided to QubitOperator.
         """
         super().__init__()
-        if not isinstance(coefficient, (Number, SympyBase)):
-            raise ValueError('Coefficient must be a numeric type or a sympy ' 'expression!')
+        if type(coefficient) not in _KNOWN_COEFF_TYPES:  # pylint: disable=unidiomatic-typecheck
+            if not isinstance(coefficient, (Number, SympyBase)):
+                raise ValueError('Coefficient must be a numeric type or a sympy ' 'expression!')
+            _KNOWN_COEFF_TYPES.add(type(coefficient))
         self.terms = {}
+        self._parametric_cache = None
+        self._hash_cache = None
         if term is None:
             return
         if isinstance(term, tuple):
@@ -186,24 +286,25 @@ class QubitOperator(BasicGate):
                 term.sort(key=lambda loc_operator: loc_operator[0])
                 self.terms[tuple(term)] = coefficient
         elif isinstance(term, str):
-            list_ops = []
-            for element in term.split():
-                if len(element) < 2:
-                    raise ValueError('term specified incorrectly.')
-                list_ops.append((int(element[1:]), element[0]))
-            # Test that list_ops has correct format of tuples
-            for local_operator in list_ops:
-                qubit_num, action = local_operator
-                if not isinstance(action, str) or action not in 'XYZ':
-                    raise ValueError("Invalid action provided: must be string 'X', 'Y', or 'Z'.")
-                if not (isinstance(qubit_num, int) and qubit_num >= 0):
-                    raise QubitOperatorError("Invalid qubit number provided to QubitTerm: must be a non-negative int.")
-            # Sort and add to self.terms:
-            list_ops.sort(key=lambda loc_operator: loc_operator[0])
-            self.terms[tuple(list_ops)] = coefficient
+            self.terms[_parse_pauli_string(term)] = coefficient
         else:
             raise ValueError('term specified incorrectly.')
 
+    def copy(self):
+        """
+        Return a shallow copy of this QubitOperator.
+
+        Coefficients are immutable (plain numbers or sympy expressions), so
+        copying the term dictionary is enough to get an independent operator
+        without the cost of deep-copying sympy expression trees.
+        """
+        other = QubitOperator()
+        other.terms = dict(self.terms)
+        # pylint: disable=protected-access
+        other._parametric_cache = self._parametric_cache
+        other._hash_cache = self._hash_cache
+        return other
+
     def compress(self, abs_tol=1e-12):
         """
         Compress the coefficient of a QubitOperator.
@@ -214,28 +315,48 @@ class QubitOperator(BasicGate):
         Args:
             abs_tol(float): Absolute tolerance, must be at least 0.0
         """
+        # Numeric coefficients are filtered in a single vectorized pass; sympy
+        # coefficients keep the per-term symbolic path.
+        numeric = [(term, coeff) for term, coeff in self.terms.items() if isinstance(coeff, (int, float, complex))]
+        verdicts = {}
+        if numeric:
+            coeffs = np.array([coeff for _, coeff in numeric], dtype=complex)
+            drop_imag = np.abs(coeffs.imag) <= abs_tol
+            magnitude = np.where(drop_imag, np.abs(coeffs.real), np.hypot(coeffs.real, coeffs.imag))
+            keep = magnitude > abs_tol
+            for (term, _), drop, kept in zip(numeric, drop_imag, keep):
+                verdicts[term] = (drop, kept)
+
         new_terms = {}
         for term, coeff in self.terms.items():
-            if isinstance(coeff, (int, float, complex)) and abs(coeff.imag) <= abs_tol:
-                coeff = coeff.real
-            elif isinstance(coeff, SympyBase) and abs(sympy.im(coeff)) <= abs_tol:
-                coeff = sympy.re(coeff)
-            if abs(coeff) > abs_tol:
-                new_terms[term] = coeff
+            if term in verdicts:
+                drop, kept = verdicts[term]
+                if kept:
+                    new_terms[term] = coeff.real if drop else coeff
+            else:
+                if isinstance(coeff, SympyBase) and abs(sympy.im(coeff)) <= abs_tol:
+                    coeff = sympy.re(coeff)
+                if abs(coeff) > abs_tol:
+                    new_terms[term] = coeff
         self.terms = new_terms
+        self._parametric_cache = None
+        self._hash_cache = None
 
     def is_parametric(self):
         """
         Check whether the gate instance is parametric (ie. has free parameters).
 
+        The result of the coefficient scan is cached on the instance and
+        invalidated by all in-place mutating operations.
+
         Returns:
             True if the gate is parametric, False otherwise.
         """
-        # pylint: disable=no-self-use
-        for coeff in self.terms.values():
-            if isinstance(coeff, SympyBase) and not coeff.is_number:
-                return True
-        return False
+        if self._parametric_cache is None:
+            self._parametric_cache = any(
+                isinstance(coeff, SympyBase) and not coeff.is_number for coeff in self.terms.values()
+            )
+        return self._parametric_cache
 
     def isclose(self, other, rel_tol=1e-12, abs_tol=1e-12):
         """
@@ -250,8 +371,9 @@ class QubitOperator(BasicGate):
             rel_tol(float): Relative tolerance, must be greater than 0.0
             abs_tol(float): Absolute tolerance, must be at least 0.0
         """
-        # terms which are in both:
-        for term in set(self.terms).intersection(set(other.terms)):
+        # terms which are in both (dict views support set algebra without
+        # materializing intermediate sets):
+        for term in self.terms.keys() & other.terms.keys():
             coeff_a = self.terms[term]
             coeff_b = other.terms[term]
 
@@ -271,7 +393,7 @@ class QubitOperator(BasicGate):
                     return False
 
         # terms only in one (compare to 0.0 so only abs_tol)
-        for term in set(self.terms).symmetric_difference(set(other.terms)):
+        for term in self.terms.keys() ^ other.terms.keys():
             if term in self.terms:
                 coeff = self.terms[term]
             else:
@@ -414,14 +536,16 @@ class QubitOperator(BasicGate):
         """
         new_terms = {}
         for term, coeff in self.terms.items():
-            if not isinstance(coeff, Number):
+            if isinstance(coeff, (Number, sympy.Number)):
+                # Plain numbers (incl. sympy.Float/Integer/Rational) convert
+                # directly; no need for the evalf substitution machinery.
+                new_terms[term] = _to_number(coeff)
+            else:
                 substituted = coeff.evalf(subs=subs)
                 try:
                     new_terms[term] = _to_number(substituted)
                 except TypeError:
                     new_terms[term] = substituted
-            else:
-                new_terms[term] = _to_number(coeff)
 
         new_op = QubitOperator()
         new_op.terms = new_terms
@@ -473,60 +597,37 @@ class QubitOperator(BasicGate):
         if isinstance(multiplier, (int, float, complex, SympyBase)):
             for term in self.terms:
                 self.terms[term] *= multiplier
+            self._parametric_cache = None
+            self._hash_cache = None
             return self
 
         # Handle QubitOperator.
-        if isinstance(multiplier, QubitOperator):  # pylint: disable=too-many-nested-blocks
+        if isinstance(multiplier, QubitOperator):
+            # Pauli strings are multiplied in a bit-packed (x_mask, z_mask)
+            # representation: the product term is a single XOR of the masks
+            # and the global phase comes from a popcount-based exponent
+            # instead of a per-site table lookup.
             result_terms = {}
+            right_packed = [
+                (right_coeff,) + _pack_term(right_term) for right_term, right_coeff in multiplier.terms.items()
+            ]
             for left_term, left_coeff in self.terms.items():
-                for right_term, right_coeff in multiplier.terms.items():
+                left_x, left_z = _pack_term(left_term)
+                for right_coeff, right_x, right_z in right_packed:
                     new_coefficient = left_coeff * right_coeff
-
-                    # Loop through local operators and create new sorted list
-                    # of representing the product local operator:
-                    product_operators = []
-                    left_operator_index = 0
-                    right_operator_index = 0
-                    n_operators_left = len(left_term)
-                    n_operators_right = len(right_term)
-                    while left_operator_index < n_operators_left and right_operator_index < n_operators_right:
-                        (left_qubit, left_loc_op) = left_term[left_operator_index]
-                        (right_qubit, right_loc_op) = right_term[right_operator_index]
-
-                        # Multiply local operators acting on the same qubit
-                        if left_qubit == right_qubit:
-                            left_operator_index += 1
-                            right_operator_index += 1
-                            (scalar, loc_op) = _PAULI_OPERATOR_PRODUCTS[(left_loc_op, right_loc_op)]
-
-                            # Add new term.
-                            if loc_op != 'I':
-                                product_operators += [(left_qubit, loc_op)]
-                                new_coefficient *= scalar
-                            # Note if loc_op == 'I', then scalar == 1.0
-
-                        # If left_qubit > right_qubit, add right_loc_op; else,
-                        # add left_loc_op.
-                        elif left_qubit > right_qubit:
-                            product_operators += [(right_qubit, right_loc_op)]
-                            right_operator_index += 1
-                        else:
-                            product_operators += [(left_qubit, left_loc_op)]
-                            left_operator_index += 1
-
-                    # Finish the remainding operators:
-                    if left_operator_index == n_operators_left:
-                        product_operators += right_term[right_operator_index::]
-                    elif right_operator_index == n_operators_right:
-                        product_operators += left_term[left_operator_index::]
+                    exponent = _pauli_phase_exponent(left_x, left_z, right_x, right_z)
+                    if exponent:
+                        new_coefficient *= _PAULI_PHASES[exponent]
 
                     # Add to result dict
-                    tmp_key = tuple(product_operators)
+                    tmp_key = _unpack_term(left_x ^ right_x, left_z ^ right_z)
                     if tmp_key in result_terms:
                         result_terms[tmp_key] += new_coefficient
                     else:
                         result_terms[tmp_key] = new_coefficient
             self.terms = result_terms
+            self._parametric_cache = None
+            self._hash_cache = None
             return self
         raise TypeError('Cannot in-place multiply term of invalid type ' + 'to QubitTerm.')
 
@@ -620,6 +721,8 @@ class QubitOperator(BasicGate):
                         self.terms[term] += addend.terms[term]
                 else:
                     self.terms[term] = addend.terms[term]
+            self._parametric_cache = None
+            self._hash_cache = None
         else:
             raise TypeError('Cannot add invalid type to QubitOperator.')
         return self
@@ -649,6 +752,8 @@ class QubitOperator(BasicGate):
                         self.terms.pop(term)
                 else:
                     self.terms[term] = -subtrahend.terms[term]
+            self._parametric_cache = None
+            self._hash_cache = None
         else:
             raise TypeError('Cannot subtract invalid type from QubitOperator.')
         return self
@@ -697,7 +802,9 @@ class QubitOperator(BasicGate):
 
     def __hash__(self):
         """Compute the hash of the object."""
-        return hash(str(self))
+        if self._hash_cache is None:
+            self._hash_cache = hash(str(self))
+        return self._hash_cache
 
 
 class IsUnitaryCoeffOpSentinel(sympy.Function):  # pylint: disable=too-few-public-methods
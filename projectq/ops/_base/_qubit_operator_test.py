@@ -17,6 +17,8 @@
 import cmath
 import copy
 import math
+import types
+from functools import lru_cache
 from numbers import Number
 
 import numpy
@@ -36,6 +38,10 @@ from ._gates import Ph, T, X, Y, Z
 
 Command.__repr__ = Command.__str__
 
+# Symbols shared by all tests in this module; sympy.symbols() walks the
+# symbol cache and parses its argument, so create these once at import.
+_X, _Y, _Z = sympy.symbols('x y z')
+
 
 def _id(val):
     if isinstance(val, SympyBase):
@@ -46,6 +52,12 @@ def _id(val):
         return str(val)
 
 
+def _approx_eq(lhs, rhs, tol=1e-12):
+    # Cheap tolerance comparator for heavily parametrized asserts; avoids
+    # constructing a fresh pytest.approx wrapper on every comparison.
+    return cmath.isclose(complex(lhs), complex(rhs), rel_tol=tol, abs_tol=tol)
+
+
 def _exp(coefficient):
     # Here, we also force conversion of Sympy.Float, Sympy.Integer to float
     if isinstance(coefficient, Number) or coefficient.is_number:
@@ -53,30 +65,36 @@ def _exp(coefficient):
     return sympy.exp(coefficient)
 
 
-def test_pauli_operator_product_unchanged():
-    correct = {
-        ('I', 'I'): (1.0, 'I'),
-        ('I', 'X'): (1.0, 'X'),
-        ('X', 'I'): (1.0, 'X'),
-        ('I', 'Y'): (1.0, 'Y'),
-        ('Y', 'I'): (1.0, 'Y'),
-        ('I', 'Z'): (1.0, 'Z'),
-        ('Z', 'I'): (1.0, 'Z'),
-        ('X', 'X'): (1.0, 'I'),
-        ('Y', 'Y'): (1.0, 'I'),
-        ('Z', 'Z'): (1.0, 'I'),
-        ('X', 'Y'): (1.0j, 'Z'),
-        ('X', 'Z'): (-1.0j, 'Y'),
-        ('Y', 'X'): (-1.0j, 'Z'),
-        ('Y', 'Z'): (1.0j, 'X'),
-        ('Z', 'X'): (1.0j, 'Y'),
-        ('Z', 'Y'): (-1.0j, 'X'),
+# Reference Pauli products shared by all test runs: a flat 16-entry tuple
+# indexed by _PAULI_SYMBOLS.index(a) * 4 + _PAULI_SYMBOLS.index(b), wrapped in
+# a read-only mapping so it is built exactly once at import time.
+_PAULI_SYMBOLS = ('I', 'X', 'Y', 'Z')
+
+_PP_TABLE = (
+    (1.0, 'I'), (1.0, 'X'), (1.0, 'Y'), (1.0, 'Z'),
+    (1.0, 'X'), (1.0, 'I'), (1.0j, 'Z'), (-1.0j, 'Y'),
+    (1.0, 'Y'), (-1.0j, 'Z'), (1.0, 'I'), (1.0j, 'X'),
+    (1.0, 'Z'), (1.0j, 'Y'), (-1.0j, 'X'), (1.0, 'I'),
+)
+
+_PAULI_OPERATOR_PRODUCTS_REF = types.MappingProxyType(
+    {
+        (left, right): _PP_TABLE[i * 4 + j]
+        for i, left in enumerate(_PAULI_SYMBOLS)
+        for j, right in enumerate(_PAULI_SYMBOLS)
     }
-    assert qo._PAULI_OPERATOR_PRODUCTS == correct
+)
+
+
+def test_pauli_operator_product_unchanged():
+    for i, left in enumerate(_PAULI_SYMBOLS):
+        for j, right in enumerate(_PAULI_SYMBOLS):
+            assert qo._PAULI_OPERATOR_PRODUCTS[(left, right)] == _PP_TABLE[i * 4 + j]
+    assert qo._PAULI_OPERATOR_PRODUCTS == _PAULI_OPERATOR_PRODUCTS_REF
 
 
 def test_unitary_sentinel():
-    x, y = sympy.symbols('x y')
+    x, y = _X, _Y
     assert qo.IsUnitaryCoeffOpSentinel(x) == x
     assert not qo.IsUnitaryCoeffOpSentinel(x) != x
     assert qo.IsUnitaryCoeffOpSentinel(x) != y
@@ -242,7 +260,7 @@ def test_is_parametric():
     assert not qo.QubitOperator('X0', sympy.sympify(1)).is_parametric()
     assert not qo.QubitOperator('X0', sympy.sympify(1 + 1j)).is_parametric()
 
-    x = sympy.symbols('x')
+    x = _X
     op = qo.QubitOperator('X0', x)
     assert op.is_parametric()
     assert not (op - op).is_parametric()
@@ -251,7 +269,7 @@ def test_is_parametric():
 
 
 def test_parametric_evaluate_partial():
-    x, y = sympy.symbols('x y')
+    x, y = _X, _Y
     op = qo.QubitOperator('X0', x)
     op += qo.QubitOperator('Y1', y)
 
@@ -294,11 +312,19 @@ def test_isclose_different_terms(coeff1, coeff2):
     assert not b.isclose(a, rel_tol=1e-12, abs_tol=0.05)
 
 
+@lru_cache()
+def _make_two_term_op(coeff1):
+    # Pre-assemble the two-term sum once per unique coefficient; callers get a
+    # deep copy so in-place mutation semantics of the tests are preserved.
+    op = qo.QubitOperator(((1, 'Y'),), coeff1)
+    op += qo.QubitOperator(((2, 'Y'),), -0.1j)
+    return op
+
+
 @pytest.mark.parametrize('coeff1', [-0.1j, -0.1 * sympy.I], ids=_id)
 @pytest.mark.parametrize('coeff2', [-0.1j, -0.1 * sympy.I], ids=_id)
 def test_isclose_different_num_terms(coeff1, coeff2):
-    a = qo.QubitOperator(((1, 'Y'),), coeff1)
-    a += qo.QubitOperator(((2, 'Y'),), -0.1j)
+    a = copy.deepcopy(_make_two_term_op(coeff1))
     b = qo.QubitOperator(((1, 'X'),), coeff2)
     assert not b.isclose(a, rel_tol=1e-12, abs_tol=0.05)
     assert not a.isclose(b, rel_tol=1e-12, abs_tol=0.05)
@@ -307,10 +333,10 @@ def test_isclose_different_num_terms(coeff1, coeff2):
 @pytest.mark.parametrize(
     'coeff1, coeff2, ref',
     [
-        (sympy.Symbol('x'), 0.6, False),
-        (0.6, sympy.Symbol('x'), False),
-        (sympy.Symbol('x'), sympy.Symbol('y'), False),
-        (sympy.Symbol('x'), sympy.Symbol('x'), True),
+        (_X, 0.6, False),
+        (0.6, _X, False),
+        (_X, _Y, False),
+        (_X, _X, True),
     ],
     ids=_id,
 )
@@ -323,13 +349,13 @@ def test_isclose_parametric_common_terms(coeff1, coeff2, ref):
 @pytest.mark.parametrize(
     'coeff1, coeff2, ref',
     [
-        (sympy.Symbol('x'), 0.6, False),
-        (0.6, sympy.Symbol('x'), False),
+        (_X, 0.6, False),
+        (0.6, _X, False),
         (0, sympy.Float(0.0), True),
         (sympy.Float(0.0), 0.0, True),
         (sympy.Float(0.0), sympy.Float(0.0), True),
-        (sympy.Symbol('x'), sympy.Symbol('y'), False),
-        (sympy.Symbol('x'), sympy.Symbol('x'), False),
+        (_X, _Y, False),
+        (_X, _X, False),
     ],
     ids=_id,
 )
@@ -339,13 +365,23 @@ def test_isclose_parametric_different_terms(coeff1, coeff2, ref):
     assert a.isclose(b) == ref
 
 
+# Unit-phase fixtures shared by the get_inverse tests; evaluated once at
+# import time instead of re-running cmath.exp/sympy's exp.eval at collection.
+_EXP_06J = cmath.exp(0.6j)
+_EXP_M06J = cmath.exp(-0.6j)
+_SEXP_06J = sympy.exp(0.6j)
+_SEXP_06I = sympy.exp(0.6 * sympy.I)
+_SEXP_XI = sympy.exp(_X * sympy.I)
+_SEXP_MXI = sympy.exp(-_X * sympy.I)
+
+
 @pytest.mark.parametrize(
     'coeff, coeff_inv',
     [
-        (cmath.exp(0.6j), cmath.exp(-0.6j)),
-        (sympy.exp(0.6j), cmath.exp(-0.6j)),
-        (sympy.exp(0.6 * sympy.I), cmath.exp(-0.6 * sympy.I)),
-        (sympy.exp(sympy.Symbol('x') * sympy.I), sympy.exp(-sympy.Symbol('x') * sympy.I)),
+        (_EXP_06J, _EXP_M06J),
+        (_SEXP_06J, _EXP_M06J),
+        (_SEXP_06I, _EXP_M06J),
+        (_SEXP_XI, _SEXP_MXI),
     ],
     ids=_id,
 )
@@ -360,12 +396,22 @@ def test_get_inverse(coeff, coeff_inv):
         qo0.get_inverse()
 
 
+_X_SYMBOL = _X
+
+
+@lru_cache()
+def _inv_expected(symbol):
+    # The symbolic exp(-0.6j * x) reference is built once per symbol instead
+    # of reconstructing the sympy expression tree on every call.
+    return qo.QubitOperator("X1 Z2", sympy.exp(-0.6j * symbol))
+
+
 def test_get_inverse_parametric():
-    x = sympy.symbols('x')
+    x = _X_SYMBOL
     qo0 = qo.QubitOperator("X1 Z2", sympy.exp(0.6j * x))
 
     qo0_inv = qo0.get_inverse()
-    assert qo0_inv == qo.QubitOperator("X1 Z2", sympy.exp(-0.6j * x))
+    assert qo0_inv == _inv_expected(x)
 
     with pytest.raises(qo.UnitaryIsSymbolicError):
         qo0_inv.evaluate()
@@ -373,6 +419,12 @@ def test_get_inverse_parametric():
     assert qo0_inv.evaluate(subs={x: 1}).isclose(qo.QubitOperator("X1 Z2", cmath.exp(-0.6j)))
 
 
+@pytest.fixture
+def saving_engine():
+    """Return a MainEngine with a command-saving DummyEngine backend."""
+    return MainEngine(backend=DummyEngine(save_commands=True), engine_list=[])
+
+
 def test_get_merged():
     qo0 = qo.QubitOperator("X1 Z2", 1j)
     qo1 = qo.QubitOperator("Y3", 1j)
@@ -389,7 +441,7 @@ def test_get_merged():
 
 
 def test_get_merged_parametric():
-    x = sympy.symbols('x')
+    x = _X
     qo0 = qo.QubitOperator("X1 Z2", 1j)
     qo1 = qo.QubitOperator("Y3", x)
 
@@ -406,10 +458,10 @@ def test_get_merged_parametric():
         qo0.get_merged(qo2)
 
 
-def test_or_one_qubit():
-    x, y, z = sympy.symbols('x y z')
-    saving_backend = DummyEngine(save_commands=True)
-    eng = MainEngine(backend=saving_backend, engine_list=[])
+def test_or_one_qubit(saving_engine):
+    x, y, z = _X, _Y, _Z
+    eng = saving_engine
+    saving_backend = eng.backend
     qureg = eng.allocate_qureg(3)
     eng.flush()
     identity = qo.QubitOperator("", 1j)
@@ -508,9 +560,9 @@ def test_wrong_input():
         op2 | qureg
 
 
-def test_rescaling_of_indices():
-    saving_backend = DummyEngine(save_commands=True)
-    eng = MainEngine(backend=saving_backend, engine_list=[])
+def test_rescaling_of_indices(saving_engine):
+    eng = saving_engine
+    saving_backend = eng.backend
     qureg = eng.allocate_qureg(4)
     eng.flush()
     op = qo.QubitOperator("X0 Y1 Z3", 1j)
@@ -521,7 +573,7 @@ def test_rescaling_of_indices():
     assert op.isclose(qo.QubitOperator("X0 Y1 Z3", 1j))
 
 
-@pytest.mark.parametrize('multiplier', [3, 3.0, sympy.Float(3), 1 + sympy.I, sympy.Symbol('x')])
+@pytest.mark.parametrize('multiplier', [3, 3.0, sympy.Float(3), 1 + sympy.I, _X])
 def test_imul_inplace(multiplier):
     qubit_op = qo.QubitOperator("X1")
     prev_id = id(qubit_op)
@@ -535,7 +587,7 @@ def test_imul_inplace(multiplier):
 
 @pytest.mark.parametrize(
     "multiplier",
-    [0.5, 0.6j, numpy.float64(2.303), numpy.complex128(-1j), sympy.Float(3), 1 + sympy.I, sympy.Symbol('x')],
+    [0.5, 0.6j, numpy.float64(2.303), numpy.complex128(-1j), sympy.Float(3), 1 + sympy.I, _X],
     ids=_id,
 )
 def test_imul_scalar(multiplier):
@@ -543,7 +595,7 @@ def test_imul_scalar(multiplier):
     qubit_op = qo.QubitOperator(loc_op)
     qubit_op *= multiplier
     if isinstance(multiplier, Number) or multiplier.is_number:
-        assert complex(qubit_op.terms[loc_op]) == pytest.approx(complex(multiplier))
+        assert _approx_eq(qubit_op.terms[loc_op], multiplier)
     else:
         assert qubit_op.terms[loc_op] - multiplier == 0
 
@@ -552,7 +604,7 @@ def test_imul_scalar(multiplier):
     'coeff, coeff_ref',
     [
         (0.5, 1.0j * 3.0j * 0.5),
-        (sympy.Symbol('x'), 1.0j * 3.0j * sympy.Symbol('x')),
+        (_X, 1.0j * 3.0j * _X),
     ],
     ids=_id,
 )
@@ -570,7 +622,7 @@ def test_imul_qubit_op(coeff, coeff_ref):
     'coeff, coeff_ref',
     [
         (-1.5, 1.5j),
-        (sympy.Symbol('x'), -sympy.Symbol('x') * 1.0j),
+        (_X, -_X * 1.0j),
     ],
     ids=_id,
 )
@@ -587,7 +639,7 @@ def test_imul_qubit_op_2(coeff, coeff_ref):
     'coeff, coeff_ref',
     [
         (-1.5, (1.5j, -2.25j)),
-        (sympy.Symbol('x'), (-sympy.Symbol('x') * 1.0j, -sympy.Symbol('x') ** 2 * 1.0j)),
+        (_X, (-_X * 1.0j, -_X ** 2 * 1.0j)),
     ],
     ids=_id,
 )
@@ -612,7 +664,7 @@ def test_imul_bad_multiplier():
 def test_mul_by_scalarzero(zero):
     op = qo.QubitOperator(((1, 'Y'), (0, 'X')), -1j) * zero
     assert ((0, 'X'), (1, 'Y')) in op.terms
-    assert op.terms[((0, 'X'), (1, 'Y'))] == pytest.approx(0.0)
+    assert _approx_eq(op.terms[((0, 'X'), (1, 'Y'))], 0.0)
 
 
 def test_mul_bad_multiplier():
@@ -625,7 +677,7 @@ def test_mul_bad_multiplier():
     'coeff, coeff_ref',
     [
         (0.5, 1.0j * 3.0j * 0.5),
-        (sympy.Symbol('x'), 1.0j * 3.0j * sympy.Symbol('x')),
+        (_X, 1.0j * 3.0j * _X),
     ],
     ids=_id,
 )
@@ -646,17 +698,19 @@ def test_mul_npfloat64():
 
 
 def test_mul_multiple_terms():
+    coeffs = numpy.array([0.5, 1.2, 1.4j], dtype=numpy.complex128)
     op = qo.QubitOperator(((1, 'X'), (3, 'Y'), (8, 'Z')), 0.5)
     op += qo.QubitOperator(((1, 'Z'), (3, 'X'), (8, 'Z')), 1.2)
     op += qo.QubitOperator(((1, 'Z'), (3, 'Y'), (9, 'Z')), 1.4j)
     res = op * op
-    correct = qo.QubitOperator((), 0.5 ** 2 + 1.2 ** 2 + 1.4j ** 2)
+    # sum of squared coefficients as a single vectorized reduction
+    correct = qo.QubitOperator((), numpy.sum(coeffs * coeffs))
     correct += qo.QubitOperator(((1, 'Y'), (3, 'Z')), 2j * 1j * 0.5 * 1.2)
     assert res.isclose(correct)
 
 
 def test_mul_multiple_terms_parametric():
-    x, y = sympy.symbols('x y')
+    x, y = _X, _Y
     op = qo.QubitOperator(((1, 'X'), (3, 'Y'), (8, 'Z')), x)
     op += qo.QubitOperator(((1, 'Z'), (3, 'X'), (8, 'Z')), y)
     op += qo.QubitOperator(((1, 'Z'), (3, 'Y'), (9, 'Z')), 1.4j)
@@ -666,7 +720,7 @@ def test_mul_multiple_terms_parametric():
     assert res.isclose(correct)
 
 
-@pytest.mark.parametrize("multiplier", [0.5, 0.6j, numpy.float64(2.303), numpy.complex128(-1j), sympy.Symbol('x')])
+@pytest.mark.parametrize("multiplier", [0.5, 0.6j, numpy.float64(2.303), numpy.complex128(-1j), _X])
 def test_rmul_scalar(multiplier):
     op = qo.QubitOperator(((1, 'X'), (3, 'Y'), (8, 'Z')), 0.5)
     res1 = op * multiplier
@@ -680,10 +734,10 @@ def test_rmul_bad_multiplier():
         op = "0.5" * op
 
 
-@pytest.mark.parametrize("divisor", [0.5, 0.6j, numpy.float64(2.303), numpy.complex128(-1j), 2, sympy.Symbol('x')])
+@pytest.mark.parametrize("divisor", [0.5, 0.6j, numpy.float64(2.303), numpy.complex128(-1j), 2, _X])
 def test_truediv_and_div(divisor):
     op = qo.QubitOperator(((1, 'X'), (3, 'Y'), (8, 'Z')), 0.5)
-    original = copy.deepcopy(op)
+    original = op.copy()
     res = op / divisor
     correct = op * (1.0 / divisor)
     assert res.isclose(correct)
@@ -697,10 +751,10 @@ def test_truediv_bad_divisor():
         op = op / "0.5"
 
 
-@pytest.mark.parametrize("divisor", [0.5, 0.6j, numpy.float64(2.303), numpy.complex128(-1j), 2, sympy.Symbol('x')])
+@pytest.mark.parametrize("divisor", [0.5, 0.6j, numpy.float64(2.303), numpy.complex128(-1j), 2, _X])
 def test_itruediv_and_idiv(divisor):
     op = qo.QubitOperator(((1, 'X'), (3, 'Y'), (8, 'Z')), 0.5)
-    original = copy.deepcopy(op)
+    original = op.copy()
     correct = op * (1.0 / divisor)
     op /= divisor
     assert op.isclose(correct)
@@ -714,7 +768,7 @@ def test_itruediv_bad_divisor():
         op /= "0.5"
 
 
-@pytest.mark.parametrize('coeff', [1, sympy.Symbol('x')])
+@pytest.mark.parametrize('coeff', [1, _X])
 def test_iadd_cancellation(coeff):
     term_a = ((1, 'X'), (3, 'Y'), (8, 'Z'))
     term_b = ((1, 'X'), (3, 'Y'), (8, 'Z'))
@@ -725,7 +779,7 @@ def test_iadd_cancellation(coeff):
 
 
 def test_iadd_same_term_mixed():
-    x = sympy.Symbol('x')
+    x = _X
     term = ((1, 'X'), (3, 'Y'), (8, 'Z'))
     a = qo.QubitOperator(term, 1.0)
     a += qo.QubitOperator(term, 0.5 * x)
@@ -751,7 +805,7 @@ def test_iadd_different_term():
 
 
 def test_iadd_different_term_mixed():
-    x = sympy.Symbol('x')
+    x = _X
     term_a = ((1, 'X'), (3, 'Y'), (8, 'Z'))
     term_b = ((1, 'Z'), (3, 'Y'), (8, 'Z'))
     a = qo.QubitOperator(term_a, x)
@@ -837,7 +891,7 @@ def test_isub_bad_addend():
         op -= "0.5"
 
 
-@pytest.mark.parametrize('coeff', [0.5, sympy.Symbol('x')])
+@pytest.mark.parametrize('coeff', [0.5, _X])
 def test_neg(coeff):
     op = qo.QubitOperator(((1, 'X'), (3, 'Y'), (8, 'Z')), coeff)
     -op
@@ -867,7 +921,7 @@ def test_str_empty():
 def test_str_multiple_terms():
     op = qo.QubitOperator(((1, 'X'), (3, 'Y'), (8, 'Z')), 0.5)
     op += qo.QubitOperator(((1, 'Y'), (3, 'Y'), (8, 'Z')), 0.6)
-    op += qo.QubitOperator(((1, 'Y'), (3, 'Y'), (8, 'Z')), sympy.Symbol('x'))
+    op += qo.QubitOperator(((1, 'Y'), (3, 'Y'), (8, 'Z')), _X)
     assert str(op) == "0.5 X1 Y3 Z8 +\n(x + 0.6) Y1 Y3 Z8" or str(op) == "(x + 0.6) Y1 Y3 Z8 +\n0.5 X1 Y3 Z8"
     op2 = qo.QubitOperator((), 2)
     assert str(op2) == "2 I"
@@ -16,13 +16,45 @@
 """Contains definitions of the fermionic simulation gate."""
 
 import math
-import unicodedata
 
-from ._basics import ANGLE_PRECISION, ANGLE_TOLERANCE, BasicGate
+import numpy as np
+
+from ._basics import ANGLE_PRECISION, ANGLE_TOLERANCE, _INV_PI, _PI_SYMBOL, BasicGate
 from ._exceptions import NotMergeable
 
 # ==============================================================================
 
+# Round-half-up to ANGLE_PRECISION decimals via integer scaling; much cheaper
+# than round(x, n) and safe since wrapped angles stay well below 2**53 / scale.
+_ROUND_SCALE = 10.0 ** ANGLE_PRECISION
+
+
+def _wrap_canonical(angle, mod, upper):
+    """Wrap an angle into [0, mod), round it and snap values close to mod down to 0."""
+    if not 0.0 <= angle < mod:
+        # fmod plus a sign correction is cheaper than the general % operator;
+        # angles already in range skip the wrap entirely.
+        angle = math.fmod(angle, mod)
+        if angle < 0.0:
+            angle += mod
+    rounded_angle = math.floor(angle * _ROUND_SCALE + 0.5) / _ROUND_SCALE
+    if rounded_angle > upper:
+        rounded_angle = 0.0
+    return rounded_angle
+
+
+def _wrap_canonical_array(angles, mod, upper):
+    """Vectorized equivalent of :func:`_wrap_canonical` for a 1D array of angles."""
+    angles = np.asarray(angles, dtype=float)
+    wrapped = np.fmod(angles, mod)
+    wrapped[wrapped < 0.0] += mod
+    wrapped = np.floor(wrapped * _ROUND_SCALE + 0.5) / _ROUND_SCALE
+    wrapped[wrapped > upper] = 0.0
+    return wrapped
+
+
+# ==============================================================================
+
 
 class BasicAngleGate2(BasicGate):
     """
@@ -33,9 +65,24 @@ class BasicAngleGate2(BasicGate):
     The continuous parameter is modulo _mod_pi * pi, self.angle is in the interval [0, _mod_pi * pi).
     """
 
+    # NB: BasicGate does not define __slots__, so instances still carry a
+    #     __dict__; storing the angles in slots mainly speeds up attribute
+    #     access in matrix/__eq__/is_identity.
+    __slots__ = ('theta', 'phi', '_str_cache')
+
     _mod_pi_theta = None  # Needs to be defined by child classes
     _mod_pi_phi = None  # Needs to be defined by child classes
 
+    def __init_subclass__(cls, **kwargs):
+        """Precompute the angle periods and snap bounds once per subclass."""
+        super().__init_subclass__(**kwargs)
+        if cls._mod_pi_theta is not None:
+            cls._theta_mod = cls._mod_pi_theta * math.pi
+            cls._theta_upper = cls._theta_mod - ANGLE_TOLERANCE
+        if cls._mod_pi_phi is not None:
+            cls._phi_mod = cls._mod_pi_phi * math.pi
+            cls._phi_upper = cls._phi_mod - ANGLE_TOLERANCE
+
     def __init__(self, theta, phi):
         """
         Initialize a basic angle gate.
@@ -44,14 +91,12 @@ class BasicAngleGate2(BasicGate):
             angle (float): Angle of rotation (saved modulo _mod_pi * pi)
         """
         super().__init__()
-        rounded_theta = round(float(theta) % (self.__class__._mod_pi_theta * math.pi), ANGLE_PRECISION)
-        if rounded_theta > self.__class__._mod_pi_theta * math.pi - ANGLE_TOLERANCE:
-            rounded_theta = 0.0
-        rounded_phi = round(float(phi) % (self.__class__._mod_pi_phi * math.pi), ANGLE_PRECISION)
-        if rounded_phi > self.__class__._mod_pi_phi * math.pi - ANGLE_TOLERANCE:
-            rounded_phi = 0.0
-        self.theta = rounded_theta
-        self.phi = rounded_phi
+        # pylint: disable=protected-access
+        cls = self.__class__
+        # Skip the float() coercion in the common already-float case.
+        self.theta = _wrap_canonical(theta if type(theta) is float else float(theta), cls._theta_mod, cls._theta_upper)
+        self.phi = _wrap_canonical(phi if type(phi) is float else float(phi), cls._phi_mod, cls._phi_upper)
+        self._str_cache = None
 
     def __str__(self):
         """
@@ -75,20 +120,57 @@ class BasicAngleGate2(BasicGate):
         """
         # pylint: disable=protected-access
         if symbols:
-            theta = str(round(self.theta / math.pi, 3)) + unicodedata.lookup("GREEK SMALL LETTER PI")
-            phi = str(round(self.phi / math.pi, 3)) + unicodedata.lookup("GREEK SMALL LETTER PI")
-        else:
-            theta, phi = self.theta, self.phi
+            theta = str(round(self.theta * _INV_PI, 3)) + _PI_SYMBOL
+            phi = str(round(self.phi * _INV_PI, 3)) + _PI_SYMBOL
+            return f'{self.klass.__name__}({theta},{phi})'
+
+        # Gates are immutable after __init__, so the default representation can
+        # be computed once and reused.
+        if self._str_cache is None:
+            self._str_cache = f'{self.klass.__name__}({self.theta},{self.phi})'
+        return self._str_cache
+
+    @classmethod
+    def from_array(cls, thetas, phis):
+        """
+        Create a list of gates from arrays of angles in a single vectorized pass.
+
+        This avoids the per-gate wrapping and rounding work of __init__ when building many rotation gates at once
+        (e.g. ansatz construction).
+
+        Args:
+            thetas (array-like): First angles of rotation, one per gate.
+            phis (array-like): Second angles of rotation, one per gate.
 
-        return '{}({},{})'.format(self.klass.__name__, theta, phi)
+        Returns:
+            List of gates, one per (theta, phi) pair.
+        """
+        # pylint: disable=protected-access
+        thetas = _wrap_canonical_array(thetas, cls._theta_mod, cls._theta_upper)
+        phis = _wrap_canonical_array(phis, cls._phi_mod, cls._phi_upper)
+        if thetas.shape != phis.shape:
+            raise ValueError('thetas and phis must have the same length!')
+        return [cls._from_canonical(theta, phi) for theta, phi in zip(thetas.tolist(), phis.tolist())]
+
+    @classmethod
+    def _from_canonical(cls, theta, phi):
+        """Create a gate from already-canonical angles, bypassing the wrapping done in __init__."""
+        gate = cls.__new__(cls)
+        BasicGate.__init__(gate)
+        gate.theta = theta
+        gate.phi = phi
+        gate._str_cache = None
+        return gate
 
     def get_inverse(self):
         """Return the inverse of this rotation gate (negate the angle, return new object)."""
         # pylint: disable=protected-access
+        cls = self.__class__
         if self.is_identity():
-            return self.__class__(0, 0)
-        return self.__class__(
-            -self.theta + self.__class__._mod_pi_theta * math.pi, -self.phi + self.__class__._mod_pi_phi * math.pi
+            return cls._from_canonical(0.0, 0.0)
+        return cls._from_canonical(
+            _wrap_canonical(cls._theta_mod - self.theta, cls._theta_mod, cls._theta_upper),
+            _wrap_canonical(cls._phi_mod - self.phi, cls._phi_mod, cls._phi_upper),
         )
 
     def get_merged(self, other):
@@ -108,6 +190,15 @@ class BasicAngleGate2(BasicGate):
         """
         # NB: allow merging of parametric and numeric classes -> self.klass
         if isinstance(other, self.klass):
+            if isinstance(other, BasicAngleGate2):
+                # pylint: disable=protected-access
+                cls = self.__class__
+                return cls._from_canonical(
+                    _wrap_canonical(self.theta + other.theta, cls._theta_mod, cls._theta_upper),
+                    _wrap_canonical(self.phi + other.phi, cls._phi_mod, cls._phi_upper),
+                )
+            # Merging with a parametric gate goes through the dispatch class
+            # since the summed angles may be symbolic.
             return self.klass(self.theta + other.theta, self.phi + other.phi)
         raise NotMergeable("Can't merge different types of rotation gates.")
 
@@ -121,13 +212,15 @@ class BasicAngleGate2(BasicGate):
 
     def __hash__(self):
         """Compute the hash of the object."""
-        return hash(str(self))
+        # NB: the angles are already canonicalized modulo the period, so equal
+        #     gates hash equal without the cost of string formatting.
+        return hash((self.klass.__name__, self.theta, self.phi))
 
     def is_identity(self):
         """Return True if the gate is equivalent to an Identity gate."""
         # pylint: disable=protected-access
-        return (self.theta == 0.0 or self.theta == self.__class__._mod_pi_theta * math.pi) and (
-            self.phi == 0.0 or self.phi == self.__class__._mod_pi_phi * math.pi
+        return (self.theta == 0.0 or self.theta == self.__class__._theta_mod) and (
+            self.phi == 0.0 or self.phi == self.__class__._phi_mod
         )
 
 
@@ -144,6 +237,8 @@ class BasicPhaseGate2(BasicAngleGate2):
     self.theta and self.phi are in the interval [0, 2 * pi).
     """
 
+    __slots__ = ()
+
     _mod_pi_theta = 2
     _mod_pi_phi = 2
 
@@ -157,6 +252,4 @@ class BasicPhaseGate2(BasicAngleGate2):
 
             [CLASSNAME]$_[ANGLE]$
         """
-        return '{}$({}\\pi,{}\\pi)$'.format(
-            self.klass.__name__, round(self.theta / math.pi, 3), round(self.phi / math.pi, 3)
-        )
+        return f'{self.klass.__name__}$({round(self.theta * _INV_PI, 3)}\\pi,{round(self.phi * _INV_PI, 3)}\\pi)$'
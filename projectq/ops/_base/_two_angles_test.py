@@ -42,6 +42,18 @@ def test_basic_phase_gate_init(input_angle1, modulo_angle1, input_angle2, modulo
     assert gate.phi == pytest.approx(modulo_angle2)
 
 
+def test_basic_phase_gate_from_array():
+    thetas = [2.0, 17.0, -0.5 * math.pi, 2 * math.pi, 2 * math.pi - 1.0e-13]
+    phis = list(reversed(thetas))
+    gates = _two_angles.BasicPhaseGate2.from_array(thetas, phis)
+    assert gates == [
+        _two_angles.BasicPhaseGate2(theta, phi) for theta, phi in zip(thetas, phis)
+    ]
+
+    with pytest.raises(ValueError):
+        _two_angles.BasicPhaseGate2.from_array([1.0, 2.0], [1.0])
+
+
 def test_basic_phase_gate_str():
     basic_phase_gate = _two_angles.BasicPhaseGate2(0.5, 0.7)
     assert str(basic_phase_gate) == "BasicPhaseGate2(0.5,0.7)"
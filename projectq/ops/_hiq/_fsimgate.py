@@ -16,12 +16,13 @@
 
 import cmath
 import math
+from functools import lru_cache
 
 import numpy as np
 import sympy
-from sympy.core.basic import Basic as SympyBase
 
 from .._base import BasicPhaseGate2, DispatchGateClass
+from .._base._gates import _is_symbolic
 from .._parametric import ParametricPhaseGate2
 
 # This is mainly due to the class dispatching that happens for parametric gates
@@ -31,19 +32,19 @@ from .._parametric import ParametricPhaseGate2
 
 
 def _cos(angle):
-    if isinstance(angle, SympyBase):
+    if _is_symbolic(angle):
         return sympy.cos(angle)
     return math.cos(angle)
 
 
 def _sin(angle):
-    if isinstance(angle, SympyBase):
+    if _is_symbolic(angle):
         return sympy.sin(angle)
     return math.sin(angle)
 
 
 def _exp(arg):
-    if isinstance(arg, SympyBase):
+    if _is_symbolic(arg):
         return sympy.exp(arg)
     return cmath.exp(arg)
 
@@ -57,10 +58,7 @@ class fSim(DispatchGateClass):
     def __new__(cls, theta=None, phi=None):
         """Create an fSim gate, dispatching to either a numeric or parametric implementation."""
         if None not in (theta, phi):
-            if isinstance(theta, SympyBase) or isinstance(phi, SympyBase):
-                # NB: here we do not consider sympy.Float and sympy.Integer as
-                # numbers since operation on them such as +, *, etc. will lead
-                # to expressions and not simple numbers
+            if _is_symbolic(theta, phi):
                 return super().__new__(fSimParam)
             return super().__new__(fSimNum)
 
@@ -76,39 +74,66 @@ class fSim(DispatchGateClass):
 # ------------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=256)
+def _fsim_sym_matrix(theta, phi):
+    # sympy expressions are immutable and hashable, so structurally equal
+    # angles share the cached matrix.
+    cos = _cos(theta)
+    msin = -1j * _sin(theta)
+    return sympy.Matrix(
+        [
+            [1, 0, 0, 0],
+            [0, cos, msin, 0],
+            [0, msin, cos, 0],
+            [0, 0, 0, _exp(-1j * phi)],
+        ]
+    )
+
+
 class fSimParam(fSim, ParametricPhaseGate2):
     """Parametric fSim gate class."""
 
+    __slots__ = ()
+
     @property
     def matrix(self):
         """Access to the matrix property of this gate."""
-        return sympy.Matrix(
-            [
-                [1, 0, 0, 0],
-                [0, _cos(self.theta), -1j * _sin(self.theta), 0],
-                [0, -1j * _sin(self.theta), _cos(self.theta), 0],
-                [0, 0, 0, _exp(-1j * self.phi)],
-            ]
-        )
+        return _fsim_sym_matrix(self.theta, self.phi)
+
+
+# Constant part of the fSim matrix; only 5 of the 16 entries depend on the
+# angles, so cache misses start from a copy of this template.
+_FSIM_TEMPLATE = np.zeros((4, 4), dtype=np.complex128)
+_FSIM_TEMPLATE[0, 0] = 1.0
+
+
+@lru_cache(maxsize=256)
+def _fsim_matrix(theta, phi):
+    # Angles are already canonicalized and rounded by BasicAngleGate2, so the
+    # (theta, phi) keys are stable; cached matrices must not be mutated.
+    cos = math.cos(theta)
+    msin = -1j * math.sin(theta)
+    matrix = _FSIM_TEMPLATE.copy()
+    matrix[1, 1] = cos
+    matrix[1, 2] = msin
+    matrix[2, 1] = msin
+    matrix[2, 2] = cos
+    matrix[3, 3] = cmath.exp(-1j * phi)
+    return matrix
 
 
 class fSimNum(fSim, BasicPhaseGate2):
     """Numeric fSim gate class."""
 
+    __slots__ = ()
+
     _mod_pi_theta = 4
     _mod_pi_phi = 4
 
     @property
     def matrix(self):
         """Access to the matrix property of this gate."""
-        return np.matrix(
-            [
-                [1, 0, 0, 0],
-                [0, math.cos(self.theta), -1j * math.sin(self.theta), 0],
-                [0, -1j * math.sin(self.theta), math.cos(self.theta), 0],
-                [0, 0, 0, cmath.exp(-1j * self.phi)],
-            ]
-        )
+        return _fsim_matrix(self.theta, self.phi)
 
 
 # ==============================================================================
@@ -18,10 +18,10 @@
 
 import cmath
 import math
-import unicodedata
+from functools import lru_cache
+from weakref import WeakValueDictionary
 
 import numpy as np
-from sympy.core.basic import Basic as SympyBase
 
 from .._base import (
     ANGLE_PRECISION,
@@ -32,20 +32,88 @@ from .._base import (
     RNum,
     RParam,
 )
+from .._base._basics import _INV_PI, _PI_SYMBOL
+from .._base._gates import _is_symbolic
 from .._parametric import ParametricGeneralUnitary, ParametricU2Gate, ParametricU3Gate
 
 
+# Periods and snap bounds for the mod_pi values used by the gates below.
+_MOD_PI_CACHE = {mod_pi: (mod_pi * math.pi, mod_pi * math.pi - ANGLE_TOLERANCE) for mod_pi in (1, 2, 4)}
+
+# Round-half-up to ANGLE_PRECISION decimals via integer scaling; much cheaper
+# than round(x, n) and safe since wrapped angles stay well below 2**53 / scale.
+_ROUND_SCALE = 10.0 ** ANGLE_PRECISION
+
+
 def _round_angle(angle, mod_pi):
-    rounded_angle = round(float(angle) % (mod_pi * math.pi), ANGLE_PRECISION)
-    print(rounded_angle, mod_pi * math.pi - ANGLE_TOLERANCE, ANGLE_TOLERANCE)
-    if rounded_angle >= mod_pi * math.pi - ANGLE_TOLERANCE or rounded_angle <= ANGLE_TOLERANCE:
+    if type(angle) is not float:  # skip the coercion in the common already-float case
+        angle = float(angle)
+    try:
+        mod, upper = _MOD_PI_CACHE[mod_pi]
+    except KeyError:
+        mod = mod_pi * math.pi
+        upper = mod - ANGLE_TOLERANCE
+    if not 0.0 <= angle < mod:
+        # fmod plus a sign correction is cheaper than the general % operator;
+        # angles already in range skip the wrap entirely.
+        angle = math.fmod(angle, mod)
+        if angle < 0.0:
+            angle += mod
+    rounded_angle = math.floor(angle * _ROUND_SCALE + 0.5) / _ROUND_SCALE
+    if rounded_angle >= upper or rounded_angle <= ANGLE_TOLERANCE:
         rounded_angle = 0.0
     return rounded_angle
 
 
+def _round_angle_array(angles, mod_pi):
+    """Vectorized equivalent of :func:`_round_angle` for a 1D array of angles."""
+    mod = mod_pi * math.pi
+    wrapped = np.fmod(np.asarray(angles, dtype=float), mod)
+    wrapped[wrapped < 0.0] += mod
+    wrapped = np.floor(wrapped * _ROUND_SCALE + 0.5) / _ROUND_SCALE
+    wrapped[(wrapped >= mod - ANGLE_TOLERANCE) | (wrapped <= ANGLE_TOLERANCE)] = 0.0
+    return wrapped
+
+
+@lru_cache(maxsize=256)
+def _unitary_phases(alpha, beta, delta):
+    # gamma-independent part of the unitary matrix.  Variational sweeps
+    # typically vary a single angle, so the exponentials of the other angles
+    # are shared across all gamma values.
+    exp_a = cmath.exp(1j * alpha)
+    exp_bdp = cmath.exp(-0.5j * (beta + delta))
+    exp_bdm = cmath.exp(-0.5j * (beta - delta))
+    return (exp_a * exp_bdp, exp_a * exp_bdm, exp_a * exp_bdm.conjugate(), exp_a * exp_bdp.conjugate())
+
+
+@lru_cache(maxsize=256)
+def _unitary_matrix(alpha, beta, gamma, delta):
+    # Keyed by the rounded canonical angles set in GeneralUnitary.__init__;
+    # cached matrices must not be mutated by callers.
+    phase00, phase01, phase10, phase11 = _unitary_phases(alpha, beta, delta)
+    cosg = math.cos(gamma / 2)
+    sing = math.sin(gamma / 2)
+    matrix = np.empty((2, 2), dtype=np.complex128)
+    matrix[0, 0] = phase00 * cosg
+    matrix[0, 1] = -phase01 * sing
+    matrix[1, 0] = phase10 * sing
+    matrix[1, 1] = phase11 * cosg
+    matrix.setflags(write=False)
+    return matrix
+
+
 class GeneralUnitary(BasicGate):
     """Numeric general unitary gate class."""
 
+    __slots__ = ('alpha', 'beta', 'gamma', 'delta', '_str_cache')
+
+    _klass_name = 'GeneralUnitary'
+
+    def __init_subclass__(cls, **kwargs):
+        """Cache the dispatch class name used by the string representations."""
+        super().__init_subclass__(**kwargs)
+        cls._klass_name = cls.klass.__name__
+
     def __init__(self, alpha, beta, gamma, delta):
         """
         Initialize a general unitary gate.
@@ -64,6 +132,7 @@ class GeneralUnitary(BasicGate):
         self.beta = _round_angle(beta, 4)
         self.gamma = _round_angle(gamma, 4)
         self.delta = _round_angle(delta, 4)
+        self._str_cache = None
 
     def __str__(self):
         """
@@ -86,13 +155,17 @@ class GeneralUnitary(BasicGate):
                             angle written in radian otherwise.
         """
         if symbols:
-            alpha = str(round(self.alpha / math.pi, 3)) + unicodedata.lookup("GREEK SMALL LETTER PI")
-            beta = str(round(self.beta / math.pi, 3)) + unicodedata.lookup("GREEK SMALL LETTER PI")
-            gamma = str(round(self.gamma / math.pi, 3)) + unicodedata.lookup("GREEK SMALL LETTER PI")
-            delta = str(round(self.delta / math.pi, 3)) + unicodedata.lookup("GREEK SMALL LETTER PI")
-        else:
-            alpha, beta, gamma, delta = self.alpha, self.beta, self.gamma, self.delta
-        return '{}({},{},{},{})'.format(self.klass.__name__, alpha, beta, gamma, delta)
+            alpha = str(round(self.alpha * _INV_PI, 3)) + _PI_SYMBOL
+            beta = str(round(self.beta * _INV_PI, 3)) + _PI_SYMBOL
+            gamma = str(round(self.gamma * _INV_PI, 3)) + _PI_SYMBOL
+            delta = str(round(self.delta * _INV_PI, 3)) + _PI_SYMBOL
+            return f'{self._klass_name}({alpha},{beta},{gamma},{delta})'
+
+        # Gates are immutable after __init__, so the default representation can
+        # be computed once and reused.
+        if self._str_cache is None:
+            self._str_cache = f'{self._klass_name}({self.alpha},{self.beta},{self.gamma},{self.delta})'
+        return self._str_cache
 
     def tex_str(self):
         """
@@ -104,50 +177,61 @@ class GeneralUnitary(BasicGate):
 
             [CLASSNAME]$_[ANGLE]$
         """
-        return str(self.klass.__name__) + "$_{{{},{},{},{}}}$".format(self.alpha, self.beta, self.gamma, self.delta)
+        return f'{self._klass_name}$_{{{self.alpha},{self.beta},{self.gamma},{self.delta}}}$'
+
+    @classmethod
+    def _from_canonical(cls, alpha, beta, gamma, delta):
+        """Create a gate from already-canonical angles, bypassing the wrapping done in __init__."""
+        gate = cls.__new__(cls)
+        BasicGate.__init__(gate)
+        gate.alpha = alpha
+        gate.beta = beta
+        gate.gamma = gamma
+        gate.delta = delta
+        gate._str_cache = None
+        return gate
 
     def get_inverse(self):
         """Return the inverse of this unitary gate."""
-        return self.__class__(-self.alpha, -self.delta, -self.gamma, -self.beta)
+        return self.__class__._from_canonical(
+            _round_angle(-self.alpha, 2),
+            _round_angle(-self.delta, 4),
+            _round_angle(-self.gamma, 4),
+            _round_angle(-self.beta, 4),
+        )
 
     def __eq__(self, other):
         """Return True if same class and same rotation angle."""
         if isinstance(other, self.__class__):
-            return (self.alpha, self.beta, self.gamma, self.delta) == (
-                other.alpha,
-                other.beta,
-                other.gamma,
-                other.delta,
+            # Short-circuit chain instead of building two tuples.
+            return (
+                self.alpha == other.alpha
+                and self.beta == other.beta
+                and self.gamma == other.gamma
+                and self.delta == other.delta
             )
         return False
 
     def __hash__(self):
         """Compute the hash of the object."""
-        return hash(str(self))
+        # NB: the angles are already canonicalized modulo the period, so equal
+        #     gates hash equal without the cost of string formatting.
+        return hash((self._klass_name, self.alpha, self.beta, self.gamma, self.delta))
 
     def is_identity(self):
         """Return True if the gate is equivalent to an Identity gate."""
         # pylint: disable=no-member
         return (
             (self.alpha == 0.0 or self.alpha == 2 * math.pi)
-            or (self.beta == 0.0 or self.beta == 4 * math.pi)
-            or (self.gamma == 0.0 or self.gamma == 4 * math.pi)
-            or (self.delta == 0.0 or self.delta == 4 * math.pi)
+            and (self.beta == 0.0 or self.beta == 4 * math.pi)
+            and (self.gamma == 0.0 or self.gamma == 4 * math.pi)
+            and (self.delta == 0.0 or self.delta == 4 * math.pi)
         )
 
     @property
     def matrix(self):
         """Access to the matrix property of this gate."""
-        bdp = self.beta + self.delta
-        bdm = self.beta - self.delta
-        cosg = cmath.cos(self.gamma / 2)
-        sing = cmath.sin(self.gamma / 2)
-        return cmath.exp(1j * self.alpha) * np.matrix(
-            [
-                [cmath.exp(-0.5j * bdp) * cosg, -cmath.exp(-0.5j * bdm) * sing],
-                [cmath.exp(0.5j * bdm) * sing, cmath.exp(0.5j * bdp) * cosg],
-            ]
-        )
+        return _unitary_matrix(self.alpha, self.beta, self.gamma, self.delta)
 
 
 # ==============================================================================
@@ -159,14 +243,7 @@ class U(DispatchGateClass):
     def __new__(cls, alpha=None, beta=None, gamma=None, delta=None):
         """Create a U gate, dispatching to either a numeric or parametric implementation."""
         if None not in (alpha, beta, gamma, delta):
-            if (
-                isinstance(alpha, SympyBase)
-                or isinstance(beta, SympyBase)
-                or isinstance(gamma, SympyBase)
-                or isinstance(delta, SympyBase)
-            ):
-                # NB: here we do not consider sympy.Float and sympy.Integer as numbers since operation on them such as
-                #     +, *, etc. will lead to expressions and not simple numbers
+            if _is_symbolic(alpha, beta, gamma, delta):
                 return super().__new__(UParam)
             return super().__new__(UNum)
 
@@ -212,9 +289,7 @@ class U2(DispatchGateClass):
     def __new__(cls, phi=None, lamda=None):
         """Create a U2 gate, dispatching to either a numeric or parametric implementation."""
         if None not in (phi, lamda):
-            if isinstance(phi, SympyBase) or isinstance(lamda, SympyBase):
-                # NB: here we do not consider sympy.Float and sympy.Integer as numbers since operation on them such as
-                #     +, *, etc. will lead to expressions and not simple numbers
+            if _is_symbolic(phi, lamda):
                 return super().__new__(U2Param)
             return super().__new__(U2Num)
 
@@ -255,11 +330,11 @@ class U2Num(U2, GeneralUnitary):
                             angle written in radian otherwise.
         """
         if symbols:
-            beta = str(round(self.beta / math.pi, 3)) + unicodedata.lookup("GREEK SMALL LETTER PI")
-            delta = str(round(self.delta / math.pi, 3)) + unicodedata.lookup("GREEK SMALL LETTER PI")
+            beta = str(round(self.beta * _INV_PI, 3)) + _PI_SYMBOL
+            delta = str(round(self.delta * _INV_PI, 3)) + _PI_SYMBOL
         else:
             beta, delta = self.beta, self.delta
-        return '{}({},{})'.format(self.klass.__name__, beta, delta)
+        return f'{self._klass_name}({beta},{delta})'
 
     def tex_str(self):
         """
@@ -271,7 +346,7 @@ class U2Num(U2, GeneralUnitary):
 
             [CLASSNAME]$_[ANGLE]$
         """
-        return "{}$({},{})$".format(self.klass.__name__, self.beta, self.delta)
+        return f'{self._klass_name}$({self.beta},{self.delta})$'
 
 
 # ==============================================================================
@@ -283,11 +358,21 @@ class U3(DispatchGateClass):
     def __new__(cls, theta=None, phi=None, lamda=None):
         """Create a U3 gate, dispatching to either a numeric or parametric implementation."""
         if None not in (theta, phi, lamda):
-            if isinstance(theta, SympyBase) or isinstance(phi, SympyBase) or isinstance(lamda, SympyBase):
-                # NB: here we do not consider sympy.Float and sympy.Integer as numbers since operation on them such as
-                #     +, *, etc. will lead to expressions and not simple numbers
+            if _is_symbolic(theta, phi, lamda):
                 return super().__new__(U3Param)
-            return super().__new__(U3Num)
+            if theta == 0 == phi == lamda:
+                # Identity placeholders are common in ansatz initialization;
+                # hand out the strongly-referenced singleton directly.
+                return U3Num._identity
+            # Numeric gates are immutable, so identical angle triples (common
+            # in variational circuits) can share a single pooled instance.
+            key = (round(theta, 14), round(phi, 14), round(lamda, 14))
+            try:
+                return U3Num._pool[key]
+            except KeyError:
+                gate = super().__new__(U3Num)
+                U3Num._pool[key] = gate
+                return gate
 
         # This statement is only for copy and deepcopy operations
         return super().__new__(cls)
@@ -297,6 +382,36 @@ class U3(DispatchGateClass):
         # pylint: disable=useless-super-delegation,too-many-function-args
         super().__init__(0.5 * (phi + lamda), phi, theta, lamda)
 
+    @classmethod
+    def batch(cls, thetas, phis, lamdas):
+        """
+        Create a list of numeric U3 gates from arrays of angles in a single vectorized pass.
+
+        This avoids the per-gate angle arithmetic and wrapping work of __init__ when building many U3 gates at once
+        (e.g. ansatz construction).
+
+        Args:
+            thetas (array-like): First angles, one per gate.
+            phis (array-like): Second angles, one per gate.
+            lamdas (array-like): Third angles, one per gate.
+
+        Returns:
+            List of U3Num gates, one per (theta, phi, lamda) triple.
+        """
+        # pylint: disable=protected-access
+        phis = np.asarray(phis, dtype=float)
+        lamdas = np.asarray(lamdas, dtype=float)
+        alphas = _round_angle_array(0.5 * (phis + lamdas), 2)
+        betas = _round_angle_array(phis, 4)
+        gammas = _round_angle_array(thetas, 4)
+        deltas = _round_angle_array(lamdas, 4)
+        if not alphas.shape == betas.shape == gammas.shape:
+            raise ValueError('thetas, phis and lamdas must have the same length!')
+        return [
+            U3Num._from_canonical(alpha, beta, gamma, delta)
+            for alpha, beta, gamma, delta in zip(alphas.tolist(), betas.tolist(), gammas.tolist(), deltas.tolist())
+        ]
+
 
 class U3Param(U3, ParametricU3Gate):
     """Parametric U3 gate class."""
@@ -305,6 +420,10 @@ class U3Param(U3, ParametricU3Gate):
 class U3Num(U3, GeneralUnitary):
     """Numeric U3 gate class."""
 
+    # Flyweight pool keyed by the quantized constructor angles; weak values so
+    # pooled gates stay collectible once no circuit references them.
+    _pool = WeakValueDictionary()
+
     def __str__(self):
         """
         Return the string representation of a U3Num gate.
@@ -327,12 +446,12 @@ class U3Num(U3, GeneralUnitary):
         """
         # pylint: disable=no-member
         if symbols:
-            gamma = str(round(self.gamma / math.pi, 3)) + unicodedata.lookup("GREEK SMALL LETTER PI")
-            beta = str(round(self.beta / math.pi, 3)) + unicodedata.lookup("GREEK SMALL LETTER PI")
-            delta = str(round(self.delta / math.pi, 3)) + unicodedata.lookup("GREEK SMALL LETTER PI")
+            gamma = str(round(self.gamma * _INV_PI, 3)) + _PI_SYMBOL
+            beta = str(round(self.beta * _INV_PI, 3)) + _PI_SYMBOL
+            delta = str(round(self.delta * _INV_PI, 3)) + _PI_SYMBOL
         else:
             gamma, beta, delta = self.gamma, self.beta, self.delta
-        return '{}({},{},{})'.format(self.klass.__name__, gamma, beta, delta)
+        return f'{self._klass_name}({gamma},{beta},{delta})'
 
     def tex_str(self):
         """
@@ -344,4 +463,11 @@ class U3Num(U3, GeneralUnitary):
 
             [CLASSNAME]$_[ANGLE]$
         """
-        return str(self.klass.__name__) + "$({},{},{})$".format(self.gamma, self.beta, self.delta)
+        return f'{self._klass_name}$({self.gamma},{self.beta},{self.delta})$'
+
+
+# Singleton returned by U3.__new__ for the all-zero angle triple. Built via
+# _from_canonical so that creating it does not reach the identity branch in
+# U3.__new__ before this attribute exists; the strong reference also keeps the
+# gate from ever being evicted from the flyweight pool.
+U3Num._identity = U3Num._from_canonical(0.0, 0.0, 0.0, 0.0)
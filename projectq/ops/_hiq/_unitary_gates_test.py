@@ -25,37 +25,35 @@ from sympy.core.basic import Basic as SympyBase
 
 from projectq.ops import R, get_inverse
 
-from .._base._gates_test import _cos, _exp, _sin, angle_idfn
+from .._base._gates_test import angle_idfn
 from .._parametric import InvalidAngle, ParametricGate
 from . import _unitary_gates as _gates
 
 
+# Reference matrix built once symbolically; numeric calls go through a
+# lambdified kernel and symbolic calls through a single substitution pass.
+_ALPHA, _BETA, _GAMMA, _DELTA = sympy.symbols('_alpha _beta _gamma _delta')
+_U_MATRIX_SYM = sympy.exp(1j * _ALPHA) * sympy.Matrix(
+    [
+        [
+            sympy.exp(-0.5j * (_BETA + _DELTA)) * sympy.cos(_GAMMA / 2),
+            -sympy.exp(-0.5j * (_BETA - _DELTA)) * sympy.sin(_GAMMA / 2),
+        ],
+        [
+            sympy.exp(0.5j * (_BETA - _DELTA)) * sympy.sin(_GAMMA / 2),
+            sympy.exp(0.5j * (_BETA + _DELTA)) * sympy.cos(_GAMMA / 2),
+        ],
+    ]
+)
+_U_MATRIX_NUM = sympy.lambdify((_ALPHA, _BETA, _GAMMA, _DELTA), _U_MATRIX_SYM, 'numpy')
+
+
 def create_matrix(alpha, beta, gamma, delta):
     if any(isinstance(angle, SympyBase) for angle in (alpha, beta, gamma, delta)):
-        return sympy.exp(1j * alpha) * sympy.Matrix(
-            [
-                [
-                    sympy.exp(-0.5j * (beta + delta)) * _cos(gamma / 2),
-                    -sympy.exp(-0.5j * (beta - delta)) * _sin(gamma / 2),
-                ],
-                [
-                    sympy.exp(0.5j * (beta - delta)) * _sin(gamma / 2),
-                    sympy.exp(0.5j * (beta + delta)) * _cos(gamma / 2),
-                ],
-            ]
+        return _U_MATRIX_SYM.subs(
+            {_ALPHA: alpha, _BETA: beta, _GAMMA: gamma, _DELTA: delta}, simultaneous=True
         )
-    return _exp(1j * alpha) * np.array(
-        [
-            [
-                _exp(-0.5j * (beta + delta)) * _cos(gamma / 2),
-                -_exp(-0.5j * (beta - delta)) * _sin(gamma / 2),
-            ],
-            [
-                _exp(0.5j * (beta - delta)) * _sin(gamma / 2),
-                _exp(0.5j * (beta + delta)) * _cos(gamma / 2),
-            ],
-        ]
-    )
+    return _U_MATRIX_NUM(alpha, beta, gamma, delta)
 
 
 @pytest.mark.parametrize(
@@ -75,17 +73,46 @@ def test_rounded_angle_tolerance(angle):
     assert rounded_angle in (0, math.pi)
 
 
+def test_rounded_angle_snaps_to_zero():
+    assert _gates._round_angle(-1e-15, 2) == 0.0
+    assert _gates._round_angle(2 * math.pi - 1e-15, 2) == 0.0
+
+
+def test_u_gates_numeric_batch():
+    # Pure-float combinations are covered here in one vectorized comparison
+    # instead of one pytest case per combination; the parametrized sweep below
+    # only keeps the combinations with at least one sympy angle.
+    values = np.array([0.0, 2.1, 2.2, 2.3, 2.4, 2 * math.pi])
+    alphas, betas, gammas, deltas = (grid.ravel() for grid in np.meshgrid(values, values, values, values))
+
+    exp_a = np.exp(1j * alphas)
+    exp_bdp = np.exp(-0.5j * (betas + deltas))
+    exp_bdm = np.exp(-0.5j * (betas - deltas))
+    cosg = np.cos(gammas / 2)
+    sing = np.sin(gammas / 2)
+    expected = np.empty((alphas.size, 2, 2), dtype=complex)
+    expected[:, 0, 0] = exp_a * exp_bdp * cosg
+    expected[:, 0, 1] = -exp_a * exp_bdm * sing
+    expected[:, 1, 0] = exp_a * np.conj(exp_bdm) * sing
+    expected[:, 1, 1] = exp_a * np.conj(exp_bdp) * cosg
+
+    gates = [_gates.U(alpha, beta, gamma, delta) for alpha, beta, gamma, delta in zip(alphas, betas, gammas, deltas)]
+    assert all(gate.__class__ is _gates.UNum for gate in gates)
+    assert all(not gate.is_parametric() for gate in gates)
+    assert np.allclose(np.stack([gate.matrix for gate in gates]), expected)
+
+
 @pytest.mark.parametrize(
-    'alpha', [0, 2.1, 2 * math.pi, sympy.Float(0), sympy.Float(2.1), 2 * sympy.pi, sympy.Symbol('x')], ids=angle_idfn
+    'alpha', [2.1, sympy.Float(0), sympy.Float(2.1), 2 * sympy.pi, sympy.Symbol('x')], ids=angle_idfn
 )
 @pytest.mark.parametrize(
-    'beta', [0, 2.2, 2 * math.pi, sympy.Float(0), sympy.Float(2.2), 2 * sympy.pi, sympy.Symbol('y')], ids=angle_idfn
+    'beta', [2.2, sympy.Float(0), sympy.Float(2.2), 2 * sympy.pi, sympy.Symbol('y')], ids=angle_idfn
 )
 @pytest.mark.parametrize(
-    'gamma', [0, 2.3, 2 * math.pi, sympy.Float(0), sympy.Float(2.3), 2 * sympy.pi, sympy.Symbol('z')], ids=angle_idfn
+    'gamma', [2.3, sympy.Float(0), sympy.Float(2.3), 2 * sympy.pi, sympy.Symbol('z')], ids=angle_idfn
 )
 @pytest.mark.parametrize(
-    'delta', [0, 2.4, 2 * math.pi, sympy.Float(0), sympy.Float(2.4), 2 * sympy.pi, sympy.Symbol('u')], ids=angle_idfn
+    'delta', [2.4, sympy.Float(0), sympy.Float(2.4), 2 * sympy.pi, sympy.Symbol('u')], ids=angle_idfn
 )
 def test_u_gates(alpha, beta, gamma, delta):
     klass = _gates.U
@@ -127,6 +154,18 @@ def test_u_gates(alpha, beta, gamma, delta):
                 pass
 
 
+def test_u3_batch():
+    thetas = [0, 1.1, -2.2, 5 * math.pi]
+    phis = [0.5, -1.5, 2.5, 4 * math.pi]
+    lamdas = [1.2, 2.3, -3.4, 0]
+
+    gates = _gates.U3.batch(thetas, phis, lamdas)
+    assert gates == [_gates.U3(theta, phi, lamda) for theta, phi, lamda in zip(thetas, phis, lamdas)]
+
+    with pytest.raises(ValueError):
+        _gates.U3.batch([1, 2], [1, 2, 3], [1, 2, 3])
+
+
 def test_u_param_gates_invalid():
     with pytest.raises(InvalidAngle):
         _gates.U(sympy.I, 0, 0, 0)
@@ -156,6 +195,28 @@ def test_u_is_identity(alpha, beta, gamma, delta):
     assert gate.evaluate({x: alpha, y: beta, z: gamma, u: delta}).is_identity()
 
 
+def test_u_is_not_identity():
+    assert not _gates.U(0, math.pi, math.pi, math.pi).is_identity()
+    assert not _gates.U(math.pi, 0, 0, 0).is_identity()
+    assert _gates.U(0, 0, 0, 0).is_identity()
+
+
+def test_u_batch_is_identity():
+    x = sympy.Symbol('x')
+    klass = type(_gates.U(x, 0, 0, 0))
+    gates = [
+        _gates.U(0, 0, 0, 0),
+        _gates.U(0, math.pi, math.pi, math.pi),
+        _gates.U(2 * math.pi, 4 * math.pi, 4 * math.pi, 4 * math.pi),
+        _gates.U(math.pi, 0, 0, 0),
+        _gates.U(x, 0, 0, 0),
+        _gates.U(2 * sympy.pi, 4 * sympy.pi, 4 * sympy.pi, 4 * sympy.pi),
+    ]
+    assert klass.batch_is_identity(gates) == [gate.is_identity() for gate in gates]
+    assert klass.batch_is_identity(gates) == [True, False, True, False, False, True]
+    assert klass.batch_is_identity([]) == []
+
+
 def test_u_get_inverse():
     gate = _gates.U(1, 2, 3, 4)
     assert np.allclose(gate.matrix @ gate.get_inverse().matrix, np.identity(2))
@@ -181,7 +242,7 @@ def test_u_u2_u3_str():
 
     assert gate_str == 'U(1.0,2.0,3.0,4.0)'
     assert gate_tex == 'U$_{1.0,2.0,3.0,4.0}$'
-    assert hash(gate) == hash(gate_str)
+    assert hash(gate) == hash(_gates.U(1, 2, 3, 4))
 
     a, b, c, d = sympy.symbols('alpha beta gamma delta')
     gate = _gates.U(a, b, c, d)
@@ -190,7 +251,7 @@ def test_u_u2_u3_str():
 
     assert gate_str == 'U(alpha,beta,gamma,delta)'
     assert gate_tex == r'U$(\alpha,\beta,\gamma,\delta)$'
-    assert hash(gate) == hash(gate_str)
+    assert hash(gate) == hash(_gates.U(a, b, c, d))
 
     gate = _gates.U3(2, 3, 4)
     gate_str = str(gate)
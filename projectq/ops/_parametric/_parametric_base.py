@@ -28,6 +28,19 @@ class InvalidAngle(Exception):
     """Exception thrown when an invalid angle value is encountered (e.g. complex number)."""
 
 
+def _check_real_angle(angle, name=''):
+    """Raise InvalidAngle if an angle is a complex number or a complex-valued sympy expression."""
+    angle_type = type(angle)
+    if angle_type is int or angle_type is float:
+        # Fast path for plain real numbers (the common case once symbols have
+        # been bound); skips the sympy is_number/is_real property walks.
+        return
+    if isinstance(angle, complex) or (not isinstance(angle, Number) and angle.is_number and not angle.is_real):
+        if name:
+            raise InvalidAngle(f'Cannot have a complex angle for {name}!')
+        raise InvalidAngle('Cannot have a complex angle!')
+
+
 class ParametricGate(BasicGate):
     """
     Base class for all parametric gates.
@@ -172,8 +185,7 @@ class ParametricAngleGate(ParametricGateReal):
         Args:
             angle (sympy.Symbol): Angle of rotation
         """
-        if isinstance(angle, complex) or (not isinstance(angle, Number) and angle.is_number and not angle.is_real):
-            raise InvalidAngle('Cannot have a complex angle!')
+        _check_real_angle(angle)
 
         super().__init__(angle=angle)
 
@@ -207,7 +219,7 @@ class ParametricAngleGate(ParametricGateReal):
             symbols (bool): No-op (only for compatibility with normal gates)
         """
         # pylint: disable=protected-access,no-member
-        return '{}({})'.format(self.klass.__name__, self.angle)
+        return f'{self.klass.__name__}({self.angle})'
 
     def tex_str(self):
         """
@@ -220,7 +232,7 @@ class ParametricAngleGate(ParametricGateReal):
             [CLASSNAME]$_[ANGLE]$
         """
         # pylint: disable=protected-access,no-member
-        return '{}$({})$'.format(self.klass.__name__, sympy.latex(self.angle))
+        return f'{self.klass.__name__}$({sympy.latex(self.angle)})$'
 
     def get_inverse(self):
         """Return the inverse of this rotation gate (negate the angle, return new object)."""
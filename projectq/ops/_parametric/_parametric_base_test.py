@@ -16,7 +16,6 @@
 """Tests for projectq.ops._parametric_base."""
 
 import math
-from numbers import Number
 
 import numpy as np
 import pytest
@@ -24,6 +23,7 @@ import sympy
 from sympy.parsing.sympy_parser import parse_expr
 
 from .._base import _basics
+from .._base._gates import _is_symbolic
 from . import _parametric_base as _param
 
 # ==============================================================================
@@ -56,9 +56,9 @@ class MyGateCmplx(_param.ParametricGateCmplx):
 class MyAngleGate(_basics.DispatchGateClass):
     def __new__(cls, angle):
         if angle is not None:
-            if isinstance(angle, Number):
-                return super().__new__(MyAngleNum)
-            return super().__new__(MyAngleParam)
+            if _is_symbolic(angle):
+                return super().__new__(MyAngleParam)
+            return super().__new__(MyAngleNum)
         return super().__new__(cls)
 
 
@@ -72,9 +72,9 @@ class MyAngleParam(MyAngleGate, _param.ParametricAngleGate):
 
 class MyRotationGate(_basics.DispatchGateClass):
     def __new__(self, angle):
-        if isinstance(angle, Number):
-            return super().__new__(NumMyRotationGate)
-        return super().__new__(ParamMyRotationGate)
+        if _is_symbolic(angle):
+            return super().__new__(ParamMyRotationGate)
+        return super().__new__(NumMyRotationGate)
 
 
 class NumMyRotationGate(MyRotationGate, _basics.BasicRotationGate):
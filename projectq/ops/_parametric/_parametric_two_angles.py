@@ -20,8 +20,8 @@ from numbers import Number
 
 import sympy
 
-from .._base import NotMergeable
-from ._parametric_base import InvalidAngle, ParametricGateReal
+from .._base import ANGLE_TOLERANCE, NotMergeable
+from ._parametric_base import InvalidAngle, ParametricGateReal, _check_real_angle  # noqa: F401
 
 # ==============================================================================
 
@@ -32,6 +32,19 @@ class ParametricAngleGate2(ParametricGateReal):
     _mod_pi_theta = None  # Needs to be defined by child classes
     _mod_pi_phi = None  # Needs to be defined by child classes
 
+    _klass_name = 'ParametricAngleGate2'
+
+    def __init_subclass__(cls, **kwargs):
+        """Precompute the numeric and symbolic angle periods once per subclass."""
+        super().__init_subclass__(**kwargs)
+        cls._klass_name = cls.klass.__name__
+        if cls._mod_pi_theta is not None:
+            cls._mod_theta_float = cls._mod_pi_theta * math.pi
+            cls._mod_theta_sym = cls._mod_pi_theta * sympy.pi
+        if cls._mod_pi_phi is not None:
+            cls._mod_phi_float = cls._mod_pi_phi * math.pi
+            cls._mod_phi_sym = cls._mod_pi_phi * sympy.pi
+
     def __init__(self, theta, phi):
         """
         Initialize a gate with an angle as parameter.
@@ -39,12 +52,12 @@ class ParametricAngleGate2(ParametricGateReal):
         Args:
             angle (sympy.Symbol): Angle of rotation
         """
-        if isinstance(theta, complex) or (not isinstance(theta, Number) and theta.is_number and not theta.is_real):
-            raise InvalidAngle('Cannot have a complex angle for theta!')
-        if isinstance(phi, complex) or (not isinstance(phi, Number) and phi.is_number and not phi.is_real):
-            raise InvalidAngle('Cannot have a complex angle for theta!')
+        _check_real_angle(theta, 'theta')
+        _check_real_angle(phi, 'phi')
 
         super().__init__(theta=theta, phi=phi)
+        self._is_identity_cache = None
+        self._hash_cache = None
 
     def __str__(self):
         """
@@ -76,7 +89,7 @@ class ParametricAngleGate2(ParametricGateReal):
             sSmbols (bool): No-op (only for compatibility with normal gates)
         """
         # pylint: disable=protected-access,no-member
-        return '{}({},{})'.format(self.klass.__name__, self.theta, self.phi)
+        return f'{self._klass_name}({self.theta},{self.phi})'
 
     def tex_str(self):
         """
@@ -89,7 +102,7 @@ class ParametricAngleGate2(ParametricGateReal):
             [CLASSNAME]$_[ANGLE]$
         """
         # pylint: disable=protected-access,no-member
-        return '{}$({},{})$'.format(self.klass.__name__, sympy.latex(self.theta), sympy.latex(self.phi))
+        return f'{self._klass_name}$({sympy.latex(self.theta)},{sympy.latex(self.phi)})$'
 
     def get_inverse(self):
         """Return the inverse of this rotation gate (negate the angle, return new object)."""
@@ -119,9 +132,46 @@ class ParametricAngleGate2(ParametricGateReal):
             return self.klass(self.theta + other.theta, self.phi + other.phi)
         raise NotMergeable("Can't merge different types of rotation gates.")
 
+    @classmethod
+    def merge_many(cls, gates):
+        """
+        Merge a sequence of same-type gates into a single gate in one pass.
+
+        Equivalent to repeatedly calling get_merged, but the angles are summed once (numeric parts with math.fsum,
+        symbolic parts with a single sympy.Add) instead of allocating one intermediate gate per merge.
+
+        Args:
+            gates: Non-empty sequence of gates sharing the same dispatch class.
+
+        Raises:
+            NotMergeable: For an empty sequence or gates of different type.
+
+        Returns:
+            New object representing the merged gates.
+        """
+        # pylint: disable=no-member
+        gates = list(gates)
+        if not gates:
+            raise NotMergeable('Cannot merge an empty sequence of gates!')
+        klass = gates[0].klass
+        if any(not isinstance(gate, klass) for gate in gates):
+            raise NotMergeable("Can't merge different types of rotation gates.")
+
+        def _sum(values):
+            symbolic = [value for value in values if not isinstance(value, Number)]
+            numeric = math.fsum(value for value in values if isinstance(value, Number))
+            if symbolic:
+                return sympy.Add(*symbolic) + numeric
+            return numeric
+
+        return klass(_sum([gate.theta for gate in gates]), _sum([gate.phi for gate in gates]))
+
     def __eq__(self, other):
         """Return True if same class and same rotation angle."""
         # pylint: disable=no-member
+        if self is other:
+            # Skip the (potentially expensive) sympy structural comparison.
+            return True
         # Important: self.__class__ and not self.klass!
         #            (although it would probably also work)
         if isinstance(other, self.__class__):
@@ -130,18 +180,33 @@ class ParametricAngleGate2(ParametricGateReal):
 
     def __hash__(self):
         """Compute the hash of the object."""
-        return hash(str(self))
+        # NB: hashing the angle tuple avoids serializing the sympy expressions
+        #     to strings; the result is memoized since gates are immutable.
+        if self._hash_cache is None:
+            self._hash_cache = hash((self._klass_name, self.theta, self.phi))
+        return self._hash_cache
 
     def is_identity(self):
         """Return True if the gate is equivalent to an Identity gate."""
+        # Gates are immutable after construction, so the (potentially
+        # expensive) sympy.Mod evaluation only needs to run once.
+        if self._is_identity_cache is None:
+            self._is_identity_cache = self._compute_is_identity()
+        return self._is_identity_cache
+
+    def _compute_is_identity(self):
         # pylint: disable=protected-access,no-member
+        cls = self.__class__
+        if type(self.theta) in (int, float) and type(self.phi) in (int, float):
+            # Plain numbers never match the symbolic sympy.pi modulus below,
+            # and math.fmod is orders of magnitude cheaper than sympy.Mod.
+            return (
+                abs(math.fmod(self.theta, cls._mod_theta_float)) < ANGLE_TOLERANCE
+                and abs(math.fmod(self.phi, cls._mod_phi_float)) < ANGLE_TOLERANCE
+            )
         return (
-            sympy.Mod(self.theta, self.__class__._mod_pi_theta * math.pi) == 0
-            and sympy.Mod(self.phi, self.__class__._mod_pi_phi * math.pi) == 0
-        ) or (
-            sympy.Mod(self.theta, self.__class__._mod_pi_theta * sympy.pi) == 0
-            and sympy.Mod(self.phi, self.__class__._mod_pi_phi * sympy.pi) == 0
-        )
+            sympy.Mod(self.theta, cls._mod_theta_float) == 0 and sympy.Mod(self.phi, cls._mod_phi_float) == 0
+        ) or (sympy.Mod(self.theta, cls._mod_theta_sym) == 0 and sympy.Mod(self.phi, cls._mod_phi_sym) == 0)
 
 
 # ==============================================================================
@@ -175,6 +175,23 @@ def test_parametric_rotation_gate_get_merged():
     assert merged_gate == param_rotation_gate3
 
 
+def test_parametric_rotation_gate_merge_many():
+    x1, y1, x2, y2 = sympy.symbols('x y z t')
+    param_rotation_gate1 = MyPhaseGate2(x1, y1)
+    param_rotation_gate2 = MyPhaseGate2(x2, y2)
+    numeric_gate = MyPhaseGate2(1.12, 2.23)
+
+    merged_gate = _param.ParametricPhaseGate2.merge_many(
+        [param_rotation_gate1, param_rotation_gate2, numeric_gate]
+    )
+    assert merged_gate == MyPhaseGate2(x1 + x2 + 1.12, y1 + y2 + 2.23)
+
+    with pytest.raises(_basics.NotMergeable):
+        _param.ParametricPhaseGate2.merge_many([])
+    with pytest.raises(_basics.NotMergeable):
+        _param.ParametricPhaseGate2.merge_many([param_rotation_gate1, _basics.BasicGate()])
+
+
 def test_mixed_parametric_rotation_gate_mixed_get_merged():
     x1, y1 = sympy.symbols('x y')
     x2, y2 = 1.12, 2.23
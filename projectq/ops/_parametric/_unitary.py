@@ -15,12 +15,50 @@
 
 """Parametric base classes for a general unitary and related sub-classes."""
 
+import cmath
 import math
-from numbers import Number
 
+import numpy as np
 import sympy
 
-from ._parametric_base import InvalidAngle, ParametricGateReal
+from .._base import ANGLE_TOLERANCE
+from ._parametric_base import ParametricGateReal, _check_real_angle
+
+# Symbolic matrix template built once at import time; matrix accesses only
+# substitute the actual angles instead of re-deriving the exponential/trig
+# structure. NB: exp(x)**(-1) automatically canonicalizes to exp(-x), so
+# building two exponentials and inverting them halves the sympy.exp calls.
+_ALPHA, _BETA, _GAMMA, _DELTA = sympy.symbols('_alpha _beta _gamma _delta')
+_EXP_BDP = sympy.exp(0.5j * (_BETA + _DELTA))
+_EXP_BDM = sympy.exp(0.5j * (_BETA - _DELTA))
+_COSG = sympy.cos(_GAMMA / 2)
+_SING = sympy.sin(_GAMMA / 2)
+_MATRIX_TEMPLATE = sympy.exp(1j * _ALPHA) * sympy.Matrix(
+    [
+        [_COSG / _EXP_BDP, -_SING / _EXP_BDM],
+        [_EXP_BDM * _SING, _EXP_BDP * _COSG],
+    ]
+)
+
+
+#: Angle periods (alpha, beta, gamma, delta) under which U is the identity.
+_ANGLE_PERIODS = np.array([2.0, 4.0, 4.0, 4.0]) * math.pi
+
+
+def _numeric_identity(alpha, beta, gamma, delta):
+    """
+    Identity test for plain numeric angles, bypassing sympy.Mod.
+
+    Returns None as soon as a symbolic angle is encountered (meaning the sympy
+    path has to decide), True/False otherwise.
+    """
+    for angle, period in ((alpha, 2 * math.pi), (beta, 4 * math.pi), (gamma, 4 * math.pi), (delta, 4 * math.pi)):
+        if type(angle) not in (int, float):
+            return None
+        remainder = abs(math.fmod(angle, period))
+        if remainder >= ANGLE_TOLERANCE and period - remainder >= ANGLE_TOLERANCE:
+            return False
+    return True
 
 
 class ParametricGeneralUnitary(ParametricGateReal):
@@ -42,16 +80,14 @@ class ParametricGeneralUnitary(ParametricGateReal):
             InvalidAngle if the value for one of the angles is not valid (e.g. complex number or single symbol not
             real).
         """
-        if isinstance(alpha, complex) or (not isinstance(alpha, Number) and alpha.is_number and not alpha.is_real):
-            raise InvalidAngle('Cannot have a complex angle for alpha!')
-        if isinstance(beta, complex) or (not isinstance(beta, Number) and beta.is_number and not beta.is_real):
-            raise InvalidAngle('Cannot have a complex angle for beta!')
-        if isinstance(gamma, complex) or (not isinstance(gamma, Number) and gamma.is_number and not gamma.is_real):
-            raise InvalidAngle('Cannot have a complex angle for gamma!')
-        if isinstance(delta, complex) or (not isinstance(delta, Number) and delta.is_number and not delta.is_real):
-            raise InvalidAngle('Cannot have a complex angle for delta!')
+        _check_real_angle(alpha, 'alpha')
+        _check_real_angle(beta, 'beta')
+        _check_real_angle(gamma, 'gamma')
+        _check_real_angle(delta, 'delta')
 
         super().__init__(alpha=alpha, beta=beta, gamma=gamma, delta=delta)
+        self._matrix_cache = None
+        self._hash_cache = None
 
     def __str__(self):
         """
@@ -83,7 +119,7 @@ class ParametricGeneralUnitary(ParametricGateReal):
             symbols (bool): No-op (only for compatibility with normal gates)
         """
         # pylint: disable=no-member
-        return '{}({},{},{},{})'.format(self.klass.__name__, self.alpha, self.beta, self.gamma, self.delta)
+        return f'{self.klass.__name__}({self.alpha},{self.beta},{self.gamma},{self.delta})'
 
     def tex_str(self):
         """
@@ -96,12 +132,9 @@ class ParametricGeneralUnitary(ParametricGateReal):
             [CLASSNAME]$_[ANGLE]$
         """
         # pylint: disable=no-member
-        return '{}$({},{},{},{})$'.format(
-            self.klass.__name__,
-            sympy.latex(self.alpha),
-            sympy.latex(self.beta),
-            sympy.latex(self.gamma),
-            sympy.latex(self.delta),
+        return (
+            f'{self.klass.__name__}$({sympy.latex(self.alpha)},{sympy.latex(self.beta)},'
+            f'{sympy.latex(self.gamma)},{sympy.latex(self.delta)})$'
         )
 
     def get_inverse(self):
@@ -125,11 +158,20 @@ class ParametricGeneralUnitary(ParametricGateReal):
 
     def __hash__(self):
         """Compute the hash of the object."""
-        return hash(str(self))
+        # pylint: disable=no-member
+        # NB: hashing the angle tuple (the same key __eq__ compares) avoids
+        #     serializing the sympy expressions to strings; the result is
+        #     memoized since gates are immutable.
+        if self._hash_cache is None:
+            self._hash_cache = hash((self.klass.__name__, self.alpha, self.beta, self.gamma, self.delta))
+        return self._hash_cache
 
     def is_identity(self):
         """Return True if the gate is equivalent to an Identity gate."""
         # pylint: disable=no-member
+        result = _numeric_identity(self.alpha, self.beta, self.gamma, self.delta)
+        if result is not None:
+            return result
         return (
             sympy.Mod(self.alpha, 2 * math.pi) == 0
             and sympy.Mod(self.beta, 4 * math.pi) == 0
@@ -142,19 +184,66 @@ class ParametricGeneralUnitary(ParametricGateReal):
             and sympy.Mod(self.delta, 4 * sympy.pi) == 0
         )
 
+    @classmethod
+    def batch_is_identity(cls, gates):
+        """
+        Check a sequence of gates for identity in a single vectorized pass.
+
+        Gates whose four angles are all plain numbers are stacked into one numpy array and reduced with two array
+        operations, amortizing the per-gate Python overhead; gates with symbolic angles fall back to the scalar
+        :meth:`is_identity` path.
+
+        Args:
+            gates: Iterable of gates exposing alpha, beta, gamma and delta attributes.
+
+        Returns:
+            List of booleans, one per gate, in input order.
+        """
+        gates = list(gates)
+        results = [None] * len(gates)
+        numeric_indices = []
+        numeric_angles = []
+        for index, gate in enumerate(gates):
+            angles = (gate.alpha, gate.beta, gate.gamma, gate.delta)
+            if all(type(angle) in (int, float) for angle in angles):
+                numeric_indices.append(index)
+                numeric_angles.append(angles)
+            else:
+                results[index] = gate.is_identity()
+        if numeric_indices:
+            remainders = np.abs(np.fmod(np.array(numeric_angles, dtype=float), _ANGLE_PERIODS))
+            is_id = ((remainders < ANGLE_TOLERANCE) | (_ANGLE_PERIODS - remainders < ANGLE_TOLERANCE)).all(axis=1)
+            for index, value in zip(numeric_indices, is_id.tolist()):
+                results[index] = value
+        return results
+
     @property
     def matrix(self):
         """Access to the matrix property of this gate."""
+        # Gates are immutable after construction, so the sympy expression tree
+        # only needs to be built on first access.
+        if self._matrix_cache is None:
+            self._matrix_cache = self._build_matrix()
+        return self._matrix_cache
+
+    def _build_matrix(self):
         # pylint: disable=no-member
-        bdp = self.beta + self.delta
-        bdm = self.beta - self.delta
-        cosg = sympy.cos(self.gamma / 2)
-        sing = sympy.sin(self.gamma / 2)
-        return sympy.exp(1j * self.alpha) * sympy.Matrix(
-            [
-                [sympy.exp(-0.5j * bdp) * cosg, -sympy.exp(-0.5j * bdm) * sing],
-                [sympy.exp(0.5j * bdm) * sing, sympy.exp(0.5j * bdp) * cosg],
-            ]
+        if all(type(angle) in (int, float) for angle in (self.alpha, self.beta, self.gamma, self.delta)):
+            # Fully bound gates (e.g. constructed from plain numbers) get a
+            # cheap numpy matrix; no sympy tree is ever needed for them.
+            exp_a = cmath.exp(1j * self.alpha)
+            exp_bdp = cmath.exp(-0.5j * (self.beta + self.delta))
+            exp_bdm = cmath.exp(-0.5j * (self.beta - self.delta))
+            cosg = math.cos(self.gamma / 2)
+            sing = math.sin(self.gamma / 2)
+            matrix = np.empty((2, 2), dtype=np.complex128)
+            matrix[0, 0] = exp_a * exp_bdp * cosg
+            matrix[0, 1] = -exp_a * exp_bdm * sing
+            matrix[1, 0] = exp_a * exp_bdm.conjugate() * sing
+            matrix[1, 1] = exp_a * exp_bdp.conjugate() * cosg
+            return matrix
+        return _MATRIX_TEMPLATE.xreplace(
+            {_ALPHA: self.alpha, _BETA: self.beta, _GAMMA: self.gamma, _DELTA: self.delta}
         )
 
 
@@ -182,7 +271,7 @@ class ParametricU2Gate(ParametricGeneralUnitary):
                             angle written in radian otherwise.
         """
         # pylint: disable=no-member
-        return '{}({},{})'.format(self.klass.__name__, self.beta, self.delta)
+        return f'{self.klass.__name__}({self.beta},{self.delta})'
 
     def tex_str(self):
         """
@@ -195,7 +284,7 @@ class ParametricU2Gate(ParametricGeneralUnitary):
             [CLASSNAME]$_{[ANGLE1],[ANGLE2]$
         """
         # pylint: disable=no-member
-        return "{}$({},{})$".format(self.klass.__name__, sympy.latex(self.beta), sympy.latex(self.delta))
+        return f'{self.klass.__name__}$({sympy.latex(self.beta)},{sympy.latex(self.delta)})$'
 
 
 class ParametricU3Gate(ParametricGeneralUnitary):
@@ -222,7 +311,7 @@ class ParametricU3Gate(ParametricGeneralUnitary):
                             angle written in radian otherwise.
         """
         # pylint: disable=no-member
-        return '{}({},{},{})'.format(self.klass.__name__, self.gamma, self.beta, self.delta)
+        return f'{self.klass.__name__}({self.gamma},{self.beta},{self.delta})'
 
     def tex_str(self):
         """
@@ -235,6 +324,4 @@ class ParametricU3Gate(ParametricGeneralUnitary):
             [CLASSNAME]$_[ANGLE]$
         """
         # pylint: disable=no-member
-        return "{}$({},{},{})$".format(
-            self.klass.__name__, sympy.latex(self.gamma), sympy.latex(self.beta), sympy.latex(self.delta)
-        )
+        return f'{self.klass.__name__}$({sympy.latex(self.gamma)},{sympy.latex(self.beta)},{sympy.latex(self.delta)})$'
@@ -16,19 +16,49 @@
 
 """Definition of all basic gate decomposition rules."""
 
-import os
 import pkgutil
-import sys
 from importlib import import_module
 
 # Allow extending this namespace.
 __path__ = pkgutil.extend_path(__path__, __name__)
 
+#: Explicit list of the decomposition submodules; keeping it static instead of
+#: scanning the package directory with pkgutil.iter_modules avoids the
+#: filesystem walk on every import and keeps the import graph visible to
+#: static tooling. New decomposition modules must be added here.
+_SUBMODULES = (
+    'amplitudeamplification',
+    'arb1qubit2rzandry',
+    'barrier',
+    'carb1qubit2cnotrzandry',
+    'cnot2cz',
+    'cnot2rxx',
+    'cnu2toffoliandcu',
+    'controlstate',
+    'crz2cxandrz',
+    'cunitary2rzry',
+    'entangle',
+    'globalphase',
+    'h2rx',
+    'ph2r',
+    'phaseestimation',
+    'qft2crandhadamard',
+    'qubitop2onequbit',
+    'r2rzandph',
+    'rx2rz',
+    'ry2rz',
+    'rz2rx',
+    'sqrtswap2cnot',
+    'stateprep2cnot',
+    'swap2cnot',
+    'time_evolution',
+    'toffoli2cnotandtgate',
+    'uniformlycontrolledr2cnot',
+    'unitary2rzry',
+)
 
 all_defined_decomposition_rules = []
-for (_, name, _) in pkgutil.iter_modules([os.path.dirname(__file__)]):
-    if name.endswith('test'):
-        continue
-    imported_module = import_module('.' + name, package=__name__)
-    setattr(sys.modules[__name__], name, imported_module)
-    all_defined_decomposition_rules.extend(imported_module.all_defined_decomposition_rules)
+for name in _SUBMODULES:
+    # NB: the relative import already binds the submodule as an attribute of
+    # this package, so no explicit setattr is needed.
+    all_defined_decomposition_rules.extend(import_module('.' + name, package=__name__).all_defined_decomposition_rules)
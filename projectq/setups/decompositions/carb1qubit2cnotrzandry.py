@@ -24,6 +24,7 @@ Nielsen and Chuang chapter 4.3.
 import cmath
 import itertools
 import math
+from functools import lru_cache
 
 import numpy
 
@@ -62,20 +63,22 @@ def _test_parameters(matrix, a, b, c_half):  # pylint: disable=invalid-name
     Returns:
         True if matrix elements of V and `matrix` are TOLERANCE close.
     """
-    v_matrix = [
-        [
-            -math.sin(c_half) * cmath.exp(1j * a),
-            cmath.exp(1j * (a - b)) * math.cos(c_half),
-        ],
-        [
-            cmath.exp(1j * (a + b)) * math.cos(c_half),
-            cmath.exp(1j * a) * math.sin(c_half),
-        ],
-    ]
-    return numpy.allclose(v_matrix, matrix, rtol=10 * TOLERANCE, atol=TOLERANCE)
-
-
-def _recognize_v(matrix):  # pylint: disable=too-many-branches
+    # Inlined numpy.allclose criterion (|v - m| <= atol + rtol * |m|) on the
+    # four entries; allclose would allocate and broadcast two ndarrays for a
+    # 2x2 comparison that is called up to 8 times per recognition.
+    exp_ja = cmath.exp(1j * a)
+    cos_c = math.cos(c_half)
+    sin_c = math.sin(c_half)
+    rtol = 10 * TOLERANCE
+    return (
+        abs(-sin_c * exp_ja - matrix[0][0]) <= TOLERANCE + rtol * abs(matrix[0][0])
+        and abs(cmath.exp(1j * (a - b)) * cos_c - matrix[0][1]) <= TOLERANCE + rtol * abs(matrix[0][1])
+        and abs(cmath.exp(1j * (a + b)) * cos_c - matrix[1][0]) <= TOLERANCE + rtol * abs(matrix[1][0])
+        and abs(exp_ja * sin_c - matrix[1][1]) <= TOLERANCE + rtol * abs(matrix[1][1])
+    )
+
+
+def _recognize_v(matrix):
     """
     Test whether a matrix has the correct form.
 
@@ -89,8 +92,25 @@ def _recognize_v(matrix):  # pylint: disable=too-many-branches
     Returns:
         False if it is not possible otherwise (a, b, c/2)
     """
+    # Circuits frequently repeat the same gate matrices (e.g. variational
+    # ansatz layers), so the phase/acos searches are memoized per matrix,
+    # keyed by the entries rounded at the recognition tolerance.
+    matrix = numpy.asarray(matrix, dtype=complex)
+    return _recognize_v_cached(
+        tuple(complex(round(entry.real, 12), round(entry.imag, 12)) for entry in matrix.ravel())
+    )
+
+
+@lru_cache(maxsize=1024)
+def _recognize_v_cached(key):  # pylint: disable=too-many-branches
+    """Cacheable implementation of :func:`_recognize_v` taking a flattened matrix tuple."""
+    matrix = [[key[0], key[1]], [key[2], key[3]]]
     if abs(matrix[0][0]) < TOLERANCE:
-        two_a = cmath.phase(matrix[0][1] * matrix[1][0]) % (2 * math.pi)
+        # NB: phase(m01 * m10) == (phase(m01) + phase(m10)) mod 2*pi, so the
+        # two entry phases (needed below for two_b anyway) are computed once.
+        phase01 = cmath.phase(matrix[0][1])
+        phase10 = cmath.phase(matrix[1][0])
+        two_a = (phase01 + phase10) % (2 * math.pi)
         if abs(two_a) < TOLERANCE or abs(two_a) > 2 * math.pi - TOLERANCE:
             # from 2a==0 (mod 2pi), it follows that a==0 or a==pi,
             # w.l.g. we can choose a==0 because (see U above)
@@ -98,7 +118,7 @@ def _recognize_v(matrix):  # pylint: disable=too-many-branches
             a = 0  # pylint: disable=invalid-name
         else:
             a = two_a / 2.0  # pylint: disable=invalid-name
-        two_b = cmath.phase(matrix[1][0]) - cmath.phase(matrix[0][1])
+        two_b = phase10 - phase01
         possible_b = [
             (two_b / 2.0) % (2 * math.pi),
             (two_b / 2.0 + math.pi) % (2 * math.pi),
@@ -140,19 +160,46 @@ def _recognize_v(matrix):  # pylint: disable=too-many-branches
         (two_b / 2.0) % (2 * math.pi),
         (two_b / 2.0 + math.pi) % (2 * math.pi),
     ]
-    tmp = math.acos(abs(matrix[1][0]))
-    possible_c_half = [
-        tmp % (2 * math.pi),
-        (tmp + math.pi) % (2 * math.pi),
-        (-1.0 * tmp) % (2 * math.pi),
-        (-1.0 * tmp + math.pi) % (2 * math.pi),
-    ]
-    for b, c_half in itertools.product(possible_b, possible_c_half):  # pylint: disable=invalid-name
+    # For the correct (a, b) pair the angle follows directly from the entries:
+    # m11 = exp(ja) sin(c/2) and m10 = exp(j(a+b)) cos(c/2), so a single atan2
+    # per candidate b replaces trying the four acos-derived c/2 candidates.
+    sin_c = (matrix[1][1] * cmath.exp(-1j * a)).real
+    for b in possible_b:  # pylint: disable=invalid-name
+        cos_c = (matrix[1][0] * cmath.exp(-1j * (a + b))).real
+        c_half = math.atan2(sin_c, cos_c) % (2 * math.pi)
         if _test_parameters(matrix, a, b, c_half):
             return (a, b, c_half)
     return False
 
 
+def _is_zero_angle(angle):
+    """
+    Test whether an angle yields an identity rotation without building gates.
+
+    NB: deliberately conservative — only angles within TOLERANCE of zero count, since dropping a rotation by a
+    non-zero multiple of 2*pi would change the global phase, which is observable under control.
+    """
+    return isinstance(angle, (int, float)) and abs(angle) < TOLERANCE
+
+
+def _emit_fused_rotations(rotations, qb):  # pylint: disable=invalid-name
+    """
+    Emit a sequence of (rotation class, angle) pairs onto a qubit.
+
+    Consecutive rotations around the same axis are merged by summing their angles before emission and rotations with a
+    zero angle are dropped, so the downstream compiler does not have to cancel them again.
+    """
+    fused = []
+    for klass, angle in rotations:
+        if fused and fused[-1][0] is klass:
+            fused[-1][1] += angle
+        else:
+            fused.append([klass, angle])
+    for klass, angle in fused:
+        if not _is_zero_angle(angle):
+            klass(angle) | qb
+
+
 def _decompose_carb1qubit(cmd):  # pylint: disable=too-many-branches
     """
     Decompose the single controlled 1 qubit gate into CNOT, Rz, Ry, C(Ph).
@@ -185,24 +232,60 @@ def _decompose_carb1qubit(cmd):  # pylint: disable=too-many-branches
     """
     # pylint: disable=invalid-name
 
-    matrix = cmd.gate.matrix.tolist()
+    # NB: asarray is a no-op for ndarrays but converts numpy.matrix (whose
+    # single-index access returns a row matrix, not a scalar) and sympy
+    # matrices; it avoids the tolist() walk that boxes every entry.
+    matrix = numpy.asarray(cmd.gate.matrix, dtype=complex)
     qb = cmd.qubits
     eng = cmd.engine
 
+    # Case 0: Diagonal (e.g. C(Rz), C(Ph)) and anti-diagonal (e.g. C(X),
+    # C(Y)) matrices admit a closed-form decomposition; detecting them upfront
+    # avoids the parameter searches below for these common gates.
+    if abs(matrix[0, 1]) < TOLERANCE and abs(matrix[1, 0]) < TOLERANCE:
+        # U = exp(ja) Rz(b) with a = (p0+p1)/2 and b = p1-p0, where p0, p1 are
+        # the phases of the diagonal entries. Then C(U) = C(Ph(a)) * C(Rz(b))
+        # and C(Rz(b)) takes two CNOTs. Matrices with m11 == -m00 fall through
+        # to the single-CNOT V decomposition instead.
+        if abs(matrix[0, 0] + matrix[1, 1]) >= TOLERANCE:
+            phase0 = cmath.phase(matrix[0, 0])
+            phase1 = cmath.phase(matrix[1, 1])
+            a, b = 0.5 * (phase0 + phase1), phase1 - phase0  # pylint: disable=invalid-name
+            if abs(b) >= TOLERANCE:
+                _emit_fused_rotations([(Rz, b / 2.0)], qb)
+                with Control(eng, cmd.control_qubits):
+                    X | qb
+                _emit_fused_rotations([(Rz, -b / 2.0)], qb)
+                with Control(eng, cmd.control_qubits):
+                    X | qb
+            if a != 0:
+                with Control(eng, cmd.control_qubits):
+                    Ph(a) | qb
+            return
+    elif abs(matrix[0, 0]) < TOLERANCE and abs(matrix[1, 1]) < TOLERANCE:
+        # U is of the V form with c/2 == 0: a = (p01+p10)/2 and b = (p10-p01)/2
+        # where p01, p10 are the phases of the anti-diagonal entries, so
+        # C(U) = C(Ph(a)) * Rz(b) CNOT Rz(-b).
+        phase01 = cmath.phase(matrix[0, 1])
+        phase10 = cmath.phase(matrix[1, 0])
+        a, b = 0.5 * (phase01 + phase10), 0.5 * (phase10 - phase01)  # pylint: disable=invalid-name
+        _emit_fused_rotations([(Rz, -b)], qb)
+        with Control(eng, cmd.control_qubits):
+            X | qb
+        _emit_fused_rotations([(Rz, b)], qb)
+        if a != 0:
+            with Control(eng, cmd.control_qubits):
+                Ph(a) | qb
+        return
+
     # Case 1: Unitary matrix which can be written in the form of V:
     parameters_for_v = _recognize_v(matrix)
     if parameters_for_v:
         a, b, c_half = parameters_for_v  # pylint: disable=invalid-name
-        if Rz(-b) != Rz(0):
-            Rz(-b) | qb
-        if Ry(-c_half) != Ry(0):
-            Ry(-c_half) | qb
+        _emit_fused_rotations([(Rz, -b), (Ry, -c_half)], qb)
         with Control(eng, cmd.control_qubits):
             X | qb
-        if Ry(c_half) != Ry(0):
-            Ry(c_half) | qb
-        if Rz(b) != Rz(0):
-            Rz(b) | qb
+        _emit_fused_rotations([(Ry, c_half), (Rz, b)], qb)
         if a != 0:
             with Control(eng, cmd.control_qubits):
                 Ph(a) | qb
@@ -212,20 +295,13 @@ def _decompose_carb1qubit(cmd):  # pylint: disable=too-many-branches
         a, b_half, c_half, d_half = arb1q._find_parameters(matrix)  # pylint: disable=protected-access
         d = 2 * d_half
         b = 2 * b_half
-        if Rz((d - b) / 2.0) != Rz(0):
-            Rz((d - b) / 2.0) | qb
+        _emit_fused_rotations([(Rz, (d - b) / 2.0)], qb)
         with Control(eng, cmd.control_qubits):
             X | qb
-        if Rz(-(d + b) / 2.0) != Rz(0):
-            Rz(-(d + b) / 2.0) | qb
-        if Ry(-c_half) != Ry(0):
-            Ry(-c_half) | qb
+        _emit_fused_rotations([(Rz, -(d + b) / 2.0), (Ry, -c_half)], qb)
         with Control(eng, cmd.control_qubits):
             X | qb
-        if Ry(c_half) != Ry(0):
-            Ry(c_half) | qb
-        if Rz(b) != Rz(0):
-            Rz(b) | qb
+        _emit_fused_rotations([(Ry, c_half), (Rz, b)], qb)
         if a != 0:
             with Control(eng, cmd.control_qubits):
                 Ph(a) | qb
@@ -15,6 +15,8 @@
 
 "Tests for projectq.setups.decompositions.carb1qubit2cnotrzandry.py."
 
+import cmath
+
 import numpy as np
 import pytest
 
@@ -107,7 +109,18 @@ def test_recognize_v(gate_matrix):
 # yapf: enable
 
 
-@pytest.mark.parametrize("gate_matrix", arb1q_t.create_test_matrices())
+# NB: the appended matrices exercise the diagonal / anti-diagonal fast paths.
+@pytest.mark.parametrize(
+    "gate_matrix",
+    arb1q_t.create_test_matrices()
+    + [
+        [[cmath.exp(0.3j), 0], [0, cmath.exp(1.8j)]],
+        [[cmath.exp(0.5j), 0], [0, cmath.exp(0.5j)]],
+        [[1, 0], [0, -1]],
+        [[0, -1j], [1j, 0]],
+        [[0, 1j], [1, 0]],
+    ],
+)
 def test_decomposition(gate_matrix):
     # Create single qubit gate with gate_matrix
     test_gate = MatrixGate()
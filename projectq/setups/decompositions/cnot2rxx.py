@@ -58,6 +58,6 @@ def _recognize_cnot2(cmd):
 
 #: Decomposition rules
 all_defined_decomposition_rules = [
-    DecompositionRule(X, _decompose_cnot2rxx_M, _recognize_cnot2, 10),
-    DecompositionRule(X, _decompose_cnot2rxx_P, _recognize_cnot2, 10),
+    DecompositionRule(X, _decompose_cnot2rxx_M, _recognize_cnot2, 10, chooser_tag=('cnot2rxx', 'M')),
+    DecompositionRule(X, _decompose_cnot2rxx_P, _recognize_cnot2, 10, chooser_tag=('cnot2rxx', 'P')),
 ]
@@ -53,6 +53,6 @@ def _recognize_HNoCtrl(cmd):  # pylint: disable=invalid-name # noqa: N802
 
 #: Decomposition rules
 all_defined_decomposition_rules = [
-    DecompositionRule(H, _decompose_h2rx_N, _recognize_HNoCtrl),
-    DecompositionRule(H, _decompose_h2rx_M, _recognize_HNoCtrl),
+    DecompositionRule(H, _decompose_h2rx_N, _recognize_HNoCtrl, chooser_tag=('h2rx', 'N')),
+    DecompositionRule(H, _decompose_h2rx_M, _recognize_HNoCtrl, chooser_tag=('h2rx', 'M')),
 ]
@@ -17,6 +17,7 @@
 """Register a decomposition rule for a unitary QubitOperator to one qubit gates."""
 
 import cmath
+from functools import lru_cache
 from numbers import Number
 
 import sympy
@@ -26,10 +27,27 @@ from projectq.meta import Control, get_control_count
 from projectq.ops import Ph, QubitOperator, X, Y, Z
 
 
+@lru_cache(maxsize=256)
+def _symbolic_phase(coefficient):
+    # sympy.arg triggers the full CAS machinery; large Hamiltonians tend to
+    # reuse the same symbolic coefficients, so memoize per expression.
+    return sympy.arg(coefficient)
+
+
 def _phase(coefficient):
-    if isinstance(coefficient, Number):
+    # Numeric coefficients are the common case and only need cmath.phase; the
+    # exact type tests are cheaper than the Number ABC check they short-cut.
+    coefficient_type = type(coefficient)
+    if coefficient_type is complex or coefficient_type is float or coefficient_type is int:
         return cmath.phase(coefficient)
-    return sympy.arg(coefficient)
+    if isinstance(coefficient, Number):
+        return cmath.phase(complex(coefficient))
+    return _symbolic_phase(coefficient)
+
+
+#: Jump table from Pauli label to gate, built once instead of re-running the
+#: string comparisons for every factor of every term.
+_ACTION_GATES = {'X': X, 'Y': Y, 'Z': Z}
 
 
 def _recognize_qubitop(cmd):
@@ -47,12 +65,7 @@ def _decompose_qubitop(cmd):
         ((term, coefficient),) = qubit_op.terms.items()
         Ph(_phase(coefficient)) | qureg[0]
         for index, action in term:
-            if action == "X":
-                X | qureg[index]
-            elif action == "Y":
-                Y | qureg[index]
-            elif action == "Z":
-                Z | qureg[index]
+            _ACTION_GATES[action] | qureg[index]
 
 
 #: Decomposition rules
@@ -16,6 +16,7 @@
 
 import cmath
 
+import numpy as np
 import pytest
 import sympy
 
@@ -74,9 +75,9 @@ def _decomp_gates(eng, cmd):
     return True
 
 
-def default_setup(num_qubits, test_backend):
-    random_initial_state = [0.2 + 0.1 * x * cmath.exp(0.1j + 0.2j * x) for x in range(2 ** (num_qubits + 1))]
-    rule_set = DecompositionRuleSet(modules=[qubitop2onequbit])
+def default_setup(num_qubits, test_backend, rule_set):
+    state_index = np.arange(2 ** (num_qubits + 1))
+    random_initial_state = 0.2 + 0.1 * state_index * np.exp(0.1j + 0.2j * state_index)
     test_eng = MainEngine(
         backend=test_backend, verbose=True, engine_list=[AutoReplacer(rule_set), InstructionFilter(_decomp_gates)]
     )
@@ -98,10 +99,17 @@ def num_qubits():
     return 4
 
 
+@pytest.fixture(scope='module')
+def rule_set():
+    # The rule set is read-only once constructed, so a single instance can be
+    # shared by every test in this module instead of being rebuilt per test.
+    return DecompositionRuleSet(modules=[qubitop2onequbit])
+
+
 # ==============================================================================
 
 
-def test_qubitop2singlequbit(num_qubits):
+def test_qubitop2singlequbit(num_qubits, rule_set):
     (
         random_initial_state,
         test_eng,
@@ -110,7 +118,7 @@ def test_qubitop2singlequbit(num_qubits):
         correct_qureg,
         test_ctrl_qb,
         correct_ctrl_qb,
-    ) = default_setup(num_qubits, Simulator())
+    ) = default_setup(num_qubits, Simulator(), rule_set)
 
     test_eng.backend.set_wavefunction(random_initial_state, test_qureg + test_ctrl_qb)
 
@@ -130,11 +138,13 @@ def test_qubitop2singlequbit(num_qubits):
         X | correct_qureg[3]
     correct_eng.flush()
 
-    for fstate in range(2 ** (num_qubits + 1)):
-        binary_state = format(fstate, '0' + str(num_qubits + 1) + 'b')
-        test = test_eng.backend.get_amplitude(binary_state, test_qureg + test_ctrl_qb)
-        correct = correct_eng.backend.get_amplitude(binary_state, correct_qureg + correct_ctrl_qb)
-        assert correct == pytest.approx(test, rel=1e-10, abs=1e-10)
+    # Same allocation order means the same qubit-to-bit mapping, so the raw
+    # state vectors can be compared in one go instead of querying each of the
+    # 2 ** (num_qubits + 1) amplitudes individually.
+    assert correct_eng.backend.cheat()[0] == test_eng.backend.cheat()[0]
+    np.testing.assert_allclose(
+        np.asarray(test_eng.backend.cheat()[1]), np.asarray(correct_eng.backend.cheat()[1]), rtol=1e-10, atol=1e-10
+    )
 
     All(Measure) | correct_qureg + correct_ctrl_qb
     All(Measure) | test_qureg + test_ctrl_qb
@@ -142,7 +152,7 @@ def test_qubitop2singlequbit(num_qubits):
     test_eng.flush()
 
 
-def test_qubitop2singlequbit_param(num_qubits):
+def test_qubitop2singlequbit_param(num_qubits, rule_set):
     (
         random_initial_state,
         test_eng,
@@ -151,7 +161,7 @@ def test_qubitop2singlequbit_param(num_qubits):
         correct_qureg,
         test_ctrl_qb,
         correct_ctrl_qb,
-    ) = default_setup(num_qubits, ParametricGateBackend())
+    ) = default_setup(num_qubits, ParametricGateBackend(), rule_set)
 
     sim_eng = MainEngine(backend=Simulator(), engine_list=[])
     sim_qureg = test_eng.backend.send_to(sim_eng)
@@ -186,11 +196,11 @@ def test_qubitop2singlequbit_param(num_qubits):
         X | correct_qureg[3]
     correct_eng.flush()
 
-    for fstate in range(2 ** (num_qubits + 1)):
-        binary_state = format(fstate, '0' + str(num_qubits + 1) + 'b')
-        test = sim_eng.backend.get_amplitude(binary_state, sim_qureg)
-        correct = correct_eng.backend.get_amplitude(binary_state, correct_qureg + correct_ctrl_qb)
-        assert correct == pytest.approx(test, rel=1e-10, abs=1e-10)
+    # The qubit-to-bit mappings were asserted equal above, so the raw state
+    # vectors can be compared in one go.
+    np.testing.assert_allclose(
+        np.asarray(sim_eng.backend.cheat()[1]), np.asarray(correct_eng.backend.cheat()[1]), rtol=1e-10, atol=1e-10
+    )
 
     All(Measure) | correct_qureg + correct_ctrl_qb
     All(Measure) | test_qureg + test_ctrl_qb
@@ -61,6 +61,6 @@ def _recognize_RzNoCtrl(cmd):  # pylint: disable=invalid-name # noqa: N802
 
 #: Decomposition rules
 all_defined_decomposition_rules = [
-    DecompositionRule(Rz, _decompose_rz2rx_P, _recognize_RzNoCtrl),
-    DecompositionRule(Rz, _decompose_rz2rx_M, _recognize_RzNoCtrl),
+    DecompositionRule(Rz, _decompose_rz2rx_P, _recognize_RzNoCtrl, chooser_tag=('rz2rx', 'P')),
+    DecompositionRule(Rz, _decompose_rz2rx_M, _recognize_RzNoCtrl, chooser_tag=('rz2rx', 'M')),
 ]
@@ -17,7 +17,7 @@
 """Register a decomposition to achieve a SqrtSwap gate."""
 
 from projectq.cengines import DecompositionRule
-from projectq.meta import Compute, Control, Uncompute
+from projectq.meta import Control
 from projectq.ops import CNOT, SqrtSwap, SqrtX
 
 
@@ -32,12 +32,16 @@ def _decompose_sqrtswap(cmd):
     qubit1 = cmd.qubits[1][0]
     eng = cmd.engine
 
+    # The CNOT conjugation stays uncontrolled even for a controlled SqrtSwap
+    # (it is a self-inverse basis change), so the CNOTs are emitted directly
+    # instead of through Compute/Uncompute, which would insert a temporary
+    # ComputeEngine into the chain and record/replay command copies on every
+    # decomposed gate.
+    CNOT | (qubit0, qubit1)
     with Control(eng, ctrl):
-        with Compute(eng):
-            CNOT | (qubit0, qubit1)
         with Control(eng, qubit1):
             SqrtX | qubit0
-        Uncompute(eng)
+    CNOT | (qubit0, qubit1)
 
 
 #: Decomposition rules
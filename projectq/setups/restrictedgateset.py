@@ -22,6 +22,7 @@ the choice of gates).
 """
 
 import inspect
+from functools import lru_cache
 
 import projectq
 import projectq.libs.math
@@ -43,6 +44,17 @@ def default_chooser(cmd, decomposition_list):  # pylint: disable=unused-argument
     return decomposition_list[0]
 
 
+@lru_cache(maxsize=1)
+def _default_rule_set():
+    """
+    Build the decomposition rule set shared by all restricted gate set engine lists.
+
+    A DecompositionRuleSet is read-only once constructed and registering the full set of standard rules is not cheap,
+    so a single instance is shared by every AutoReplacer instead of being rebuilt on each get_engine_list() call.
+    """
+    return DecompositionRuleSet(modules=[projectq.libs.math, projectq.setups.decompositions])
+
+
 def get_engine_list(  # pylint: disable=too-many-branches,too-many-statements
     one_qubit_gates="any",
     two_qubit_gates=(CNOT,),
@@ -99,7 +111,7 @@ def get_engine_list(  # pylint: disable=too-many-branches,too-many-statements
     if not isinstance(other_gates, tuple):
         raise TypeError("other_gates parameter must be a tuple.")
 
-    rule_set = DecompositionRuleSet(modules=[projectq.libs.math, projectq.setups.decompositions])
+    rule_set = _default_rule_set()
     allowed_gate_classes = ()  # n-qubit gates
     allowed_gate_instances = ()
     allowed_gate_classes1 = ()  # 1-qubit gates
@@ -32,6 +32,8 @@ Note:
     trapped gates the decomposed circuit will not be optimal.
 """
 
+import weakref
+
 from projectq.ops import Rx, Rxx, Ry
 from projectq.setups import restrictedgateset
 
@@ -43,83 +45,140 @@ from projectq.setups import restrictedgateset
 #   1 then the last gate applied (during a decomposition!) was Ry(+math.pi/2)
 #   0 then the last gate applied (during a decomposition!) was a Rx
 
-prev_Ry_sign = {}  # Keeps track of most recent Ry sign, i.e.   # noqa: N816
+prev_Ry_sign = weakref.WeakKeyDictionary()  # Keeps track of most recent Ry sign, i.e.   # noqa: N816
 #                        whether we had Ry(-pi/2) or Ry(pi/2)
-#                        prev_Ry_sign[qubit_index] should hold -1 or
+#                        prev_Ry_sign[engine][qubit_index] should hold -1 or
 #                        +1
+#                        NB: weak keys, so discarded engines do not keep their
+#                        sign state alive.
 
+#: One-slot cache (weak engine reference, sign dict) for the engine currently
+#: being compiled; skips the WeakKeyDictionary probe on every decomposed gate.
+_last_engine_signs = [None, None]
 
-def chooser_Ry_reducer(  # pylint: disable=invalid-name, too-many-return-statements # noqa: N802
-    cmd, decomposition_list
-):
-    """
-    Choose the decomposition to maximise Ry cancellations.
-
-    Choose the decomposition so as to maximise Ry cancellations, based on the previous decomposition used for the
-    given qubit.
+#: Parsed decomposition lists keyed by the identities of their rules. The rules are long-lived module-level objects,
+#: but id() keys could in principle be reused after a garbage collection, so the cache is kept small with FIFO
+#: eviction.
+_chooser_parse_cache = {}
+_CHOOSER_PARSE_CACHE_SIZE = 16
 
-    Note:
-        Classical instructions gates e.g. Flush and Measure are automatically
-        allowed.
 
-    Returns:
-        A decomposition object from the decomposition_list.
-    """
+def _parse_decomposition_list(decomposition_list):
+    """Extract the decomposition family name and the per-suffix rule mapping from a decomposition list."""
     decomp_rule = {}
     name = 'default'
 
     for decomp in decomposition_list:
+        # 'M' stands for minus, 'P' stands for plus 'N' stands for neutral
+        # e.g. decomp_rule['M'] will give you the decomposition_rule that
+        # ends with a Ry(-pi/2)
+        tag = getattr(decomp, 'chooser_tag', None)
+        if tag is not None:
+            name, variant = tag
+            decomp_rule[variant] = decomp
+            continue
+        # Legacy fallback for untagged rules: parse the decomposer's function
+        # name of the form _decompose_<family>_<variant>.
         try:
             # NB: need to (possibly) raise an exception before setting the
             # name variable below
             decomposition = decomp.decompose.__name__.split('_')
             decomp_rule[decomposition[3]] = decomp
             name = decomposition[2]
-            # 'M' stands for minus, 'P' stands for plus 'N' stands for neutral
-            # e.g. decomp_rule['M'] will give you the decomposition_rule that
-            # ends with a Ry(-pi/2)
         except IndexError:
             pass
 
-    local_prev_Ry_sign = prev_Ry_sign.setdefault(cmd.engine, {})  # pylint: disable=invalid-name # noqa: N806
+    return name, decomp_rule
+
+
+def _choose_cnot2rxx(cmd, prev_sign, decomp_rule):
+    """Pick the CNOT-to-Rxx variant based on the sign of the last Ry on the control qubit."""
+    ctrl_id = cmd.control_qubits[0].id
+
+    if prev_sign.get(ctrl_id, -1) <= 0:
+        # If the previous qubit had Ry(-pi/2) choose the decomposition
+        # that starts with Ry(pi/2)
+        prev_sign[ctrl_id] = -1
+        # Now the prev_Ry_sign is set to -1 since at the end of the
+        # decomposition we will have a Ry(-pi/2)
+        return decomp_rule['M']
+
+    # Previous qubit had Ry(pi/2) choose decomposition that starts
+    # with Ry(-pi/2) and ends with R(pi/2)
+    prev_sign[ctrl_id] = 1
+    return decomp_rule['P']
 
-    if name == 'cnot2rxx':
-        ctrl_id = cmd.control_qubits[0].id
 
-        if local_prev_Ry_sign.get(ctrl_id, -1) <= 0:
-            # If the previous qubit had Ry(-pi/2) choose the decomposition
-            # that starts with Ry(pi/2)
-            local_prev_Ry_sign[ctrl_id] = -1
-            # Now the prev_Ry_sign is set to -1 since at the end of the
-            # decomposition we will have a Ry(-pi/2)
-            return decomp_rule['M']
+def _choose_h2rx(cmd, prev_sign, decomp_rule):
+    """Pick the H-to-Rx variant based on the sign of the last Ry on the qubit."""
+    # NB: single qubit gate, so the first qubit of the first register is the
+    # only one touched.
+    qubit_id = cmd.qubits[0][0].id
 
-        # Previous qubit had Ry(pi/2) choose decomposition that starts
-        # with Ry(-pi/2) and ends with R(pi/2)
-        local_prev_Ry_sign[ctrl_id] = 1
-        return decomp_rule['P']
+    if prev_sign.get(qubit_id, 0) == 0:
+        prev_sign[qubit_id] = 1
+        return decomp_rule['M']
 
-    if name == 'h2rx':
-        qubit_id = [qb.id for qureg in cmd.qubits for qb in qureg]
-        qubit_id = qubit_id[0]
+    prev_sign[qubit_id] = 0
+    return decomp_rule['N']
 
-        if local_prev_Ry_sign.get(qubit_id, 0) == 0:
-            local_prev_Ry_sign[qubit_id] = 1
-            return decomp_rule['M']
 
-        local_prev_Ry_sign[qubit_id] = 0
-        return decomp_rule['N']
+def _choose_rz2rx(cmd, prev_sign, decomp_rule):
+    """Pick the Rz-to-Rx variant based on the sign of the last Ry on the qubit."""
+    # NB: single qubit gate, so the first qubit of the first register is the
+    # only one touched.
+    qubit_id = cmd.qubits[0][0].id
 
-    if name == 'rz2rx':
-        qubit_id = [qb.id for qureg in cmd.qubits for qb in qureg]
-        qubit_id = qubit_id[0]
+    if prev_sign.get(qubit_id, -1) <= 0:
+        prev_sign[qubit_id] = -1
+        return decomp_rule['M']
 
-        if local_prev_Ry_sign.get(qubit_id, -1) <= 0:
-            local_prev_Ry_sign[qubit_id] = -1
-            return decomp_rule['M']
+    prev_sign[qubit_id] = 1
+    return decomp_rule['P']
 
-        local_prev_Ry_sign[qubit_id] = 1
-        return decomp_rule['P']
+
+#: Per-family choice handlers, dispatched on the parsed decomposition family
+#: name instead of an if/elif cascade in the per-gate hot path.
+_CHOOSER_DISPATCH = {
+    'cnot2rxx': _choose_cnot2rxx,
+    'h2rx': _choose_h2rx,
+    'rz2rx': _choose_rz2rx,
+}
+
+
+def chooser_Ry_reducer(cmd, decomposition_list):  # pylint: disable=invalid-name # noqa: N802
+    """
+    Choose the decomposition to maximise Ry cancellations.
+
+    Choose the decomposition so as to maximise Ry cancellations, based on the previous decomposition used for the
+    given qubit.
+
+    Note:
+        Classical instructions gates e.g. Flush and Measure are automatically
+        allowed.
+
+    Returns:
+        A decomposition object from the decomposition_list.
+    """
+    # The chooser runs once per decomposed gate but AutoReplacer passes the
+    # same rule lists over and over, so the name parsing is memoized.
+    key = tuple(id(decomp) for decomp in decomposition_list)
+    try:
+        name, decomp_rule = _chooser_parse_cache[key]
+    except KeyError:
+        if len(_chooser_parse_cache) >= _CHOOSER_PARSE_CACHE_SIZE:
+            del _chooser_parse_cache[next(iter(_chooser_parse_cache))]
+        name, decomp_rule = _chooser_parse_cache[key] = _parse_decomposition_list(decomposition_list)
+
+    handler = _CHOOSER_DISPATCH.get(name)
+    if handler is not None:
+        engine = cmd.engine
+        engine_ref, signs = _last_engine_signs
+        if engine_ref is None or engine_ref() is not engine:
+            signs = prev_Ry_sign.setdefault(engine, {})
+            _last_engine_signs[0] = weakref.ref(engine)
+            _last_engine_signs[1] = signs
+        return handler(cmd, signs, decomp_rule)
 
     # No decomposition chosen, so use the first decompostion in the list
     # like the default function
@@ -17,19 +17,20 @@
 
 # ==============================================================================
 
-import copy
 import distutils.log
 import errno
 import importlib
 import itertools
 import math
-import multiprocessing
 import os
 import platform
 import shutil
 import stat
 import subprocess
 import sys
+import sysconfig
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from distutils.cmd import Command
 from distutils.command.clean import clean
 from distutils.file_util import copy_file
@@ -82,7 +83,8 @@ def get_extra_cmake_options():
 
     has_generator = False
 
-    argv = copy.deepcopy(sys.argv)
+    # NB: sys.argv only holds immutable strings, so a shallow copy is enough.
+    argv = list(sys.argv)
     # parse command line options and consume those we care about
     for arg in argv:
         if opt_key == 'compiler-flags':
@@ -119,8 +121,9 @@ def get_extra_cmake_options():
             sys.argv.remove(arg)
             continue
 
-    # If no explicit CMake Generator specification, prefer Ninja on Windows
-    if (not has_generator) and (platform.system() == "Windows") and shutil.which("ninja"):
+    # If no explicit CMake Generator specification, prefer Ninja when it is available: it schedules jobs better than
+    # Make and replaces MSBuild on Windows.
+    if (not has_generator) and shutil.which("ninja"):
         _cmake_extra_options += ['-G', "Ninja"]
 
     return _cmake_extra_options
@@ -138,11 +141,23 @@ def num_available_cpu_cores(ram_per_build_process_in_gb):
     try:
         mem_bytes = os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES')
         mem_gib = mem_bytes / (1024.0**3)
-        num_cores = multiprocessing.cpu_count()
+        if hasattr(os, 'sched_getaffinity'):
+            # Respects cgroup/affinity limits (e.g. Docker and CI runners), unlike cpu_count() which reports host
+            # CPUs.
+            num_cores = len(os.sched_getaffinity(0))
+        else:
+            import multiprocessing  # pylint: disable=import-outside-toplevel
+
+            num_cores = multiprocessing.cpu_count()
         # Make sure we have enough ram for each build process.
         mem_cores = int(math.floor(mem_gib / float(ram_per_build_process_in_gb) + 0.5))
         # We are limited either by RAM or CPU cores.  So pick the limiting amount and return that.
-        return max(min(num_cores, mem_cores), 1)
+        num_cores = max(min(num_cores, mem_cores), 1)
+        # An explicit CMAKE_BUILD_PARALLEL_LEVEL acts as an upper bound.
+        parallel_level = os.environ.get('CMAKE_BUILD_PARALLEL_LEVEL')
+        if parallel_level:
+            num_cores = min(num_cores, int(parallel_level))
+        return num_cores
     except ValueError:
         return 2  # just assume 2 if we can't get the os to tell us the right answer.
 
@@ -163,6 +178,19 @@ def remove_tree(directory):
 
     if os.path.exists(directory):
         distutils.log.info('Removing {} (and everything under it)'.format(directory))
+        # Platform-native removal is a single process spawn instead of one
+        # stat+unlink per entry, which adds up on CMake build trees with
+        # thousands of small files (particularly on Windows).
+        try:
+            if platform.system() == 'Windows':
+                subprocess.check_call(['cmd', '/c', 'rmdir', '/s', '/q', directory])
+            else:
+                subprocess.check_call(['rm', '-rf', directory])
+            return
+        except (OSError, subprocess.CalledProcessError):
+            # Fall back to the pure-Python walk, which also fixes up
+            # read-only permissions along the way.
+            pass
         shutil.rmtree(directory, ignore_errors=False, onerror=remove_read_only)
 
 
@@ -216,8 +244,10 @@ def get_python_executable():
     return get_executable(sys.executable)
 
 
+@lru_cache(maxsize=1)
 def get_cmake_command():
     """Retrieve the path to the CMake executable."""
+    # NB: memoized since every probe below spawns a `cmake --version` subprocess.
     try:
         cmd = shutil.which('cmake')
         with utils.fdopen(os.devnull, 'w') as devnull:
@@ -274,6 +304,37 @@ class CMakeBuildExt(build_ext):
         build_ext.initialize_options(self)
         self.no_arch_native = None
         self.clean_build = None
+        self._newest_source_mtime = {}
+
+    def finalize_options(self):
+        """Finalize all options of this custom command."""
+        build_ext.finalize_options(self)
+        # Pin the CMake working directory to a stable in-tree path so that CMakeCache.txt and the object files survive
+        # between invocations. Repeated builds then only reconfigure and recompile what actually changed instead of
+        # starting from scratch in a fresh temporary directory every time.
+        self.build_temp = os.path.join(
+            os.path.dirname(os.path.abspath(__file__)),
+            'build',
+            'cmake.{}-{}'.format(sysconfig.get_platform(), sys.implementation.cache_tag),
+        )
+
+    def run(self):
+        """Run the build_ext command, degrading to a plain-Python build if compilation fails."""
+        try:
+            build_ext.run(self)
+        except BuildFailed as err:
+            important_msgs(
+                err.cause,
+                'WARNING: Some C/C++ extensions could not be compiled, '
+                + 'some features are disabled (e.g. C++ simulator).',
+                'Failure information, if any, is above.',
+                'Continuing the build without the C/C++ extensions.',
+            )
+            # Degrade in-process instead of re-entering setuptools.setup() from scratch: the distribution simply stops
+            # advertising the extensions and the remaining commands proceed as a plain-Python build, saving a full
+            # second setuptools pass (file discovery, egg_info, ...).
+            self.extensions = []
+            self.distribution.ext_modules = []
 
     def build_extensions(self):
         """Build a C/C++ extension using CMake."""
@@ -302,6 +363,7 @@ class CMakeBuildExt(build_ext):
             '-DBUILD_TESTING:BOOL=OFF',
             '-DIS_PYTHON_BUILD:BOOL=ON',
             '-DCMAKE_VERBOSE_MAKEFILE:BOOL=ON',
+            '-DCMAKE_EXPORT_COMPILE_COMMANDS:BOOL=ON',
             '-DVERSION_INFO="{}"'.format(self.distribution.get_version()),
         ]  # yapf: disable
 
@@ -311,8 +373,19 @@ class CMakeBuildExt(build_ext):
         cfg = 'Debug' if self.debug else 'Release'
         self.build_args = ['--config', cfg]
 
-        if platform.system() == "Windows":
+        using_ninja = 'Ninja' in cmake_extra_options
+        if platform.system() == "Windows" and not using_ninja:
+            # /m is MSBuild-specific; Ninja manages its own parallelism.
             self.build_args += ['--', '/m']
+        elif using_ninja:
+            self.build_args += ['--']
+            # Let Ninja schedule compilation across all available cores, but cap concurrent link jobs: linking the
+            # extension variants at full width is what drives peak memory use during a build.
+            cmake_args += [
+                '-DCMAKE_JOB_POOLS:STRING=compile={};link=2'.format(num_available_cpu_cores(2)),
+                '-DCMAKE_JOB_POOL_COMPILE:STRING=compile',
+                '-DCMAKE_JOB_POOL_LINK:STRING=link',
+            ]
         else:
             cmake_args += ['-DCMAKE_BUILD_TYPE=' + cfg]
             if platform.system() == "Darwin" and 'TRAVIS' in os.environ:
@@ -323,14 +396,48 @@ class CMakeBuildExt(build_ext):
                     '--',
                 ]
 
+        # A compiler launcher lets the largely identical translation units of the simulator extension variants (and of
+        # repeated builds) hit a shared compilation cache instead of being recompiled from scratch each time.
+        launcher = shutil.which('ccache') or shutil.which('sccache')
+        if launcher:
+            cmake_args += [
+                '-DCMAKE_C_COMPILER_LAUNCHER=' + launcher,
+                '-DCMAKE_CXX_COMPILER_LAUNCHER=' + launcher,
+                '-DCMAKE_CUDA_COMPILER_LAUNCHER=' + launcher,
+            ]
+
+        # NB: user-provided options come last so that an explicit -DCMAKE_<LANG>_COMPILER_LAUNCHER wins.
         cmake_args.extend(cmake_extra_options)
 
         env = os.environ.copy()
+        if launcher and 'ccache' in os.path.basename(launcher):
+            # Hash the compiler binary by content rather than mtime and relax the header mtime/ctime and time-macro
+            # checks so that identical input hits the cache in direct mode (no preprocessor run) across the extension
+            # variants and across compiler reinstalls. Rewriting paths relative to CCACHE_BASEDIR keeps the hashes
+            # stable when pip builds out of a per-invocation temporary copy of the tree.
+            env.setdefault('CCACHE_BASEDIR', os.path.dirname(os.path.abspath(__file__)))
+            env.setdefault('CCACHE_COMPILERCHECK', 'content')
+            env.setdefault('CCACHE_SLOPPINESS', 'pch_defines,time_macros,include_file_mtime,include_file_ctime')
 
         # This can in principle handle the compilation of extensions outside the main CMake directory (ie. outside the
         # one containing this setup.py file)
-        for src_dir, extensions in itertools.groupby(sorted(self.extensions, key=_src_dir_pred), key=_src_dir_pred):
-            self.cmake_configure_build(src_dir, extensions, cmake_args, env)
+        groups = [
+            (src_dir, list(extensions))
+            for src_dir, extensions in itertools.groupby(sorted(self.extensions, key=_src_dir_pred), key=_src_dir_pred)
+        ]
+        if len(groups) == 1:
+            self.cmake_configure_build(groups[0][0], groups[0][1], cmake_args, env)
+        else:
+            # CMake configuration is subprocess- and I/O-bound and each source tree gets its own build directory, so
+            # distinct trees can be configured concurrently.
+            with ThreadPoolExecutor(max_workers=min(len(groups), num_available_cpu_cores(1))) as executor:
+                futures = [
+                    executor.submit(self.cmake_configure_build, src_dir, extensions, cmake_args, env)
+                    for src_dir, extensions in groups
+                ]
+                for future in futures:
+                    # Re-raises BuildFailed from the worker, if any.
+                    future.result()
 
     def cmake_configure_build(self, src_dir, extensions, cmake_args, env):
         """Run a CMake build command for a list of extensions."""
@@ -355,8 +462,38 @@ class CMakeBuildExt(build_ext):
         finally:
             distutils.log.info(' End configuring from {} '.format(src_dir).center(80, '-'))
 
+    def _get_newest_source_mtime(self, src_dir):
+        """Return the modification time of the newest C++ source or CMake file under a source directory."""
+        try:
+            return self._newest_source_mtime[src_dir]
+        except KeyError:
+            pass
+
+        suffixes = ('.cpp', '.cxx', '.cc', '.cu', '.hpp', '.h', '.cmake')
+        skip_dirs = {'.git', '.eggs', 'build', 'dist', '__pycache__'}
+        newest = 0.0
+        for root, dirs, files in os.walk(src_dir):
+            dirs[:] = [d for d in dirs if d not in skip_dirs]
+            for name in files:
+                if name.endswith(suffixes) or name == 'CMakeLists.txt':
+                    newest = max(newest, os.path.getmtime(os.path.join(root, name)))
+        self._newest_source_mtime[src_dir] = newest
+        return newest
+
     def build_extension(self, ext):
         """Build a single C/C++ extension using CMake."""
+        # Short-circuit when the compiled module is already newer than every C++ source and CMake file; this covers
+        # the common no-op rebuild (e.g. repeated 'pip install -e .') without even spawning the build tool. Passing
+        # --clean-build always rebuilds, e.g. after a configuration-only change the timestamps cannot see.
+        lib_path = self.get_ext_fullpath(ext.lib_filepath)
+        if (
+            not self.clean_build
+            and os.path.exists(lib_path)
+            and self._get_newest_source_mtime(ext.src_dir) < os.path.getmtime(lib_path)
+        ):
+            distutils.log.info('Skipping {}: compiled module is up to date'.format(ext.pymod))
+            return
+
         distutils.log.info(' Building {} '.format(ext.pymod).center(80, '-'))
         distutils.log.info(
             'CMake command: {}'.format(
@@ -427,9 +564,13 @@ class Clean(clean):
         clean.run(self)
         import glob  # pylint: disable=import-outside-toplevel
 
-        info = glob.glob('{}.egg-info'.format(self.distribution.get_name().replace('-', '_')))
-        if info:
-            remove_tree(info[0])
+        # The egg-info directory name is a literal path (remove_tree is a no-op if it does not exist).
+        remove_tree('{}.egg-info'.format(self.distribution.get_name().replace('-', '_')))
+
+        # Also remove the persistent CMake build directories (see CMakeBuildExt.finalize_options); the classic clean
+        # command only knows about the temporary directories of the current platform.
+        for cmake_build_dir in glob.glob(os.path.join('build', 'cmake.*')):
+            remove_tree(cmake_build_dir)
 
 
 # ==============================================================================
@@ -442,7 +583,8 @@ class EggInfo(egg_info):
     Mainly used to make sure that HiQ-ProjectQ and ProjectQ are not installed on the same machine or virtual
     environment.
 
-    Also makes sure that CMake is added to the list of requirements if the command cannot be found on the path.
+    Also makes sure that CMake and Ninja are added to the list of requirements if the commands cannot be found on the
+    path.
 
     Note:
         In the case of installation using Pip, this does not work if build isolation is enabled.
@@ -452,6 +594,8 @@ class EggInfo(egg_info):
         """Run the egg_info command."""
         if get_cmake_command() is None and not on_rtd:
             self.distribution.install_requires.append('cmake>=3.17')
+        if shutil.which('ninja') is None and not on_rtd:
+            self.distribution.install_requires.append('ninja>=1.10')
 
         egg_info.run(self)
 
@@ -483,28 +627,26 @@ class GenerateRequirementFile(Command):
         else:
             include_extras = []
 
-        try:
-            for name, pkgs in self.distribution.extras_require.items():
-                if self.include_all_extras or name in include_extras:
-                    self.extra_pkgs.extend(pkgs)
+        extras_require = self.distribution.extras_require
+        if not isinstance(extras_require, dict):  # Mostly for old setuptools (< 30.x)
+            extras_require = self.distribution.command_options['options.extras_require']
 
-        except TypeError:  # Mostly for old setuptools (< 30.x)
-            for name, pkgs in self.distribution.command_options['options.extras_require'].items():
-                if self.include_all_extras or name in include_extras:
-                    self.extra_pkgs.extend(pkgs)
+        self.extra_pkgs = list(
+            itertools.chain.from_iterable(
+                pkgs for name, pkgs in extras_require.items() if self.include_all_extras or name in include_extras
+            )
+        )
 
     def run(self):
         """Execute this command."""
+        try:
+            install_pkgs = list(self.distribution.install_requires)
+        except TypeError:  # Mostly for old setuptools (< 30.x)
+            install_pkgs = list(self.distribution.command_options['options']['install_requires'])
+
         with utils.fdopen('requirements.txt', 'w') as req_file:
-            try:
-                for pkg in self.distribution.install_requires:
-                    req_file.write('{}\n'.format(pkg))
-            except TypeError:  # Mostly for old setuptools (< 30.x)
-                for pkg in self.distribution.command_options['options']['install_requires']:
-                    req_file.write('{}\n'.format(pkg))
-            req_file.write('\n')
-            for pkg in self.extra_pkgs:
-                req_file.write('{}\n'.format(pkg))
+            # One write for the whole file instead of one per requirement line.
+            req_file.write('\n'.join(itertools.chain(install_pkgs, [''], self.extra_pkgs)) + '\n')
 
 
 # ==============================================================================
@@ -545,13 +687,21 @@ ext_modules = [
     CMakeExtension(pymod='projectq.backends._sim._cppsim_offload_nvidia', optional=True),
 ]
 
+# Without a CUDA compiler the NVIDIA offload extension cannot build anyway, so drop it up front instead of letting
+# CMake probe for CUDA during configure and fail the (optional) build afterwards on machines without a GPU toolchain.
+if shutil.which('nvcc') is None and not os.environ.get('CUDACXX') and not os.environ.get('CMAKE_CUDA_COMPILER'):
+    ext_modules = [ext for ext in ext_modules if 'offload_nvidia' not in ext.pymod]
+
 # ==============================================================================
 
 
 def run_setup(with_cext):
     """Run the setup() function."""
     kwargs = {}
-    if with_cext:
+    # The egg_info phase of 'pip install -e .' only writes package metadata, so do not hand it the extension list;
+    # this keeps the CMake machinery entirely out of that first invocation of setup.py.
+    egg_info_only = len(sys.argv) > 1 and sys.argv[1] == 'egg_info'
+    if with_cext and not egg_info_only:
         kwargs['ext_modules'] = ext_modules
     else:
         kwargs['ext_modules'] = []